@@ -0,0 +1,134 @@
+#############################################################
+# Module Name: Sugar Pop Benchmark Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Headless physics benchmarks for the sugar pop game
+#############################################################
+import argparse
+import os
+import time
+import pymunk
+from settings import WIDTH, HEIGHT, MAX_TIME_STEP, SOLVER_THREADS, SOLVER_THREAD_COUNTS, START_FLOW, LOAD_NEW_LEVEL
+import static_item
+import sugar_grain
+
+# Grain setups compared by the shapes benchmark
+GRAIN_SETUPS = {
+    'poly': {'shape': 'poly'},
+    'circle': {'shape': 'circle'},
+    'circle-no-stacking': {'shape': 'circle', 'collide_with_grains': False},
+}
+
+def build_space():
+    """
+    Build an empty space configured like the game's, walled in to the screen.
+    """
+    space = pymunk.Space()
+    space.gravity = (0, -10)
+    space.iterations = 30
+    for x1, y1, x2, y2 in ((0, 0, WIDTH, 0), (0, 0, 0, HEIGHT), (WIDTH, 0, WIDTH, HEIGHT)):
+        static_item.StaticItem(space, x1, y1, x2, y2)
+    return space
+
+def time_steps(space, steps):
+    """
+    Return the mean wall-clock time of one space step in milliseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(steps):
+        space.step(MAX_TIME_STEP)
+    return (time.perf_counter() - start) * 1000 / steps
+
+def bench_shapes(counts, settle_steps, steps):
+    """
+    Measure step time for each grain setup at increasing grain counts. The
+    grains start as a dense block so most contacts are grain against grain.
+    """
+    print(f"{'grains':>8} " + ' '.join(f'{name:>20}' for name in GRAIN_SETUPS) + '   (ms per step)')
+    for count in counts:
+        results = []
+        for options in GRAIN_SETUPS.values():
+            space = build_space()
+            columns = 200
+            for i in range(count):
+                sugar_grain.sugar_grain(space, 212 + 3 * (i % columns), 10 + 3 * (i // columns), 0.1, **options)
+            for _ in range(settle_steps):
+                space.step(MAX_TIME_STEP)
+            results.append(time_steps(space, steps))
+        print(f'{count:>8} ' + ' '.join(f'{ms:>20.3f}' for ms in results))
+
+def run_level(number, threaded, threads, settle_ticks, steps):
+    """
+    Play a level headless from its start with the spout already flowing,
+    fast enough that every grain is out by the end of the settle ticks so the
+    timed ticks see a full level.
+
+    :return: Mean milliseconds per tick over the timed steps, and the final grain positions.
+    """
+    import main as game_main  # Opens a (dummy) display, so only for this benchmark
+    game = game_main.Game(threaded=threaded, solver_threads=threads)
+    game.scheduler.cancel(LOAD_NEW_LEVEL)
+    game.load_level(number)
+    game.scheduler.cancel(START_FLOW)
+    game.level_grain_dropping = True
+    drops = max(1, settle_ticks // 20)  # The game drops every 20 ticks
+    game.grains_per_drop = max(game.grains_per_drop, -(-game.total_sugar_count // drops))
+    for _ in range(settle_ticks):
+        game.tick()
+    start = time.perf_counter()
+    for _ in range(steps):
+        game.tick()
+    ms = (time.perf_counter() - start) * 1000 / steps
+    positions, _ = game.grains.state()
+    return ms, [tuple(p) for p in positions]
+
+def bench_threads(threads, settle_ticks, steps):
+    """
+    Compare tick time on every shipped level between the plain solver and the
+    threaded one, and check determinism: each mode is run twice and must
+    reproduce its own grain positions exactly. Whether the threaded result
+    matches the plain one is reported too.
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    from soak import level_numbers
+
+    # Report the thread count Pymunk actually uses, read back from a space
+    probe = pymunk.Space(threaded=True)
+    probe.threads = threads
+    threads = probe.threads
+
+    print(f"{'level':>6} {'plain ms':>10} {f'{threads} threads ms':>14} {'speedup':>8}"
+          f" {'plain repeatable':>17} {'threaded repeatable':>20} {'matches plain':>14}")
+    for number in level_numbers():
+        plain = [run_level(number, False, 1, settle_ticks, steps) for _ in range(2)]
+        threaded = [run_level(number, True, threads, settle_ticks, steps) for _ in range(2)]
+        plain_ms = min(ms for ms, _ in plain)
+        threaded_ms = min(ms for ms, _ in threaded)
+        print(f'{number:>6} {plain_ms:>10.3f} {threaded_ms:>14.3f} {plain_ms / threaded_ms:>7.2f}x'
+              f' {str(plain[0][1] == plain[1][1]):>17} {str(threaded[0][1] == threaded[1][1]):>20}'
+              f' {str(plain[0][1] == threaded[0][1]):>14}')
+
+def main():
+    parser = argparse.ArgumentParser(description='Sugar Pop physics benchmarks')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    shapes = subparsers.add_parser('shapes', help='step time per grain shape at increasing counts')
+    shapes.add_argument('--counts', type=int, nargs='+', default=[250, 500, 1000, 2000, 4000])
+    shapes.add_argument('--settle-steps', type=int, default=120, help='steps to run before timing')
+    shapes.add_argument('--steps', type=int, default=120, help='steps to time')
+
+    threads = subparsers.add_parser('threads', help='plain versus threaded solver on every shipped level')
+    threads.add_argument('--threads', type=int, default=SOLVER_THREADS, choices=SOLVER_THREAD_COUNTS,
+                         help='threads for the threaded solver')
+    threads.add_argument('--settle-ticks', type=int, default=600, help='ticks to run before timing')
+    threads.add_argument('--steps', type=int, default=300, help='ticks to time')
+
+    args = parser.parse_args()
+    if args.benchmark == 'shapes':
+        bench_shapes(args.counts, args.settle_steps, args.steps)
+    elif args.benchmark == 'threads':
+        bench_threads(args.threads, args.settle_ticks, args.steps)
+
+if __name__ == '__main__':
+    main()
@@ -8,8 +8,7 @@
 
 import pygame as pg
 import pymunk
-from settings import SCALE, HEIGHT, WIDTH
-from math import sqrt
+from settings import SCALE, BUCKET_BURST_PARTICLES
 
 class Bucket:
     def __init__(self, space, x, y, width, height, needed_sugar):
@@ -35,10 +34,15 @@ class Bucket:
         x_pymunk = x / SCALE
         y_pymunk = y / SCALE # (HEIGHT - y) / SCALE  # Adjust y-coordinate for Pymunk's coordinate system
 
+        # The walls share a static body of their own rather than the space's,
+        # which would keep them alive after the bucket is gone
+        self.body = pymunk.Body(body_type=pymunk.Body.STATIC)
+        space.add(self.body)
+
         # Left wall
         left_wall_start = (x_pymunk - self.width / 2, y_pymunk - self.height / 2)
         left_wall_end = (x_pymunk - self.width / 2, y_pymunk + self.height / 2)
-        self.left_wall = pymunk.Segment(space.static_body, left_wall_start, left_wall_end, wall_thickness)
+        self.left_wall = pymunk.Segment(self.body, left_wall_start, left_wall_end, wall_thickness)
         self.left_wall.friction = 0.5
         self.left_wall.elasticity = 0.5
         space.add(self.left_wall)
@@ -46,7 +50,7 @@ class Bucket:
         # Right wall
         right_wall_start = (x_pymunk + self.width / 2, y_pymunk - self.height / 2)
         right_wall_end = (x_pymunk + self.width / 2, y_pymunk + self.height / 2)
-        self.right_wall = pymunk.Segment(space.static_body, right_wall_start, right_wall_end, wall_thickness)
+        self.right_wall = pymunk.Segment(self.body, right_wall_start, right_wall_end, wall_thickness)
         self.right_wall.friction = 0.5
         self.right_wall.elasticity = 0.5
         space.add(self.right_wall)
@@ -54,18 +58,38 @@ class Bucket:
         # Bottom wall
         bottom_wall_start = (x_pymunk - self.width / 2, y_pymunk - self.height / 2)
         bottom_wall_end = (x_pymunk + self.width / 2, y_pymunk - self.height / 2)
-        self.bottom_wall = pymunk.Segment(space.static_body, bottom_wall_start, bottom_wall_end, wall_thickness)
+        self.bottom_wall = pymunk.Segment(self.body, bottom_wall_start, bottom_wall_end, wall_thickness)
         self.bottom_wall.friction = 0.5
         self.bottom_wall.elasticity = 0.5
         space.add(self.bottom_wall)
         
         self.exploded = False  # Track if the bucket has exploded
 
-    def explode(self, grains):
+    @classmethod
+    def from_level(cls, space, data):
+        """
+        Build a bucket from its entry in the level file.
+        """
+        return cls(space, data['x'], data['y'], data['width'], data['height'], data['needed_sugar'])
+
+    @classmethod
+    def draw_all(cls, items, screen, view):
+        """
+        Draw every bucket that hasn't exploded, each as a single open polyline.
+        """
+        color = (144, 238, 144)  # Light green color
+        width = view.line_width(2)
+        for item in items:
+            if not item.exploded:
+                points = [item.left_wall.b, item.left_wall.a, item.right_wall.a, item.right_wall.b]
+                pg.draw.lines(screen, color, False, [view.to_screen(p) for p in points], width)
+
+    def explode(self, grains, particles=None):
         """
         Apply a radial force to all grains near the bucket and remove the bucket walls.
         
-        :param grains: List of sugar grain objects in the game.
+        :param grains: The grain backend holding the game's sugar grains.
+        :param particles: Optional particle system for the visual burst.
         """
         if self.exploded:
             return  # Prevent multiple explosions
@@ -74,79 +98,48 @@ class Bucket:
         bucket_center_x = (self.left_wall.a[0] + self.right_wall.a[0]) / 2
         bucket_center_y = (self.left_wall.a[1] + self.left_wall.b[1]) / 2
 
-        # Apply radial force to each grain
-        for grain in grains:
-            grain_pos = grain.body.position
-
-            # Calculate the vector from the bucket center to the grain
-            dx = grain_pos.x - bucket_center_x
-            dy = grain_pos.y - bucket_center_y
-            distance = sqrt(dx**2 + dy**2)
+        # Push away the grains within a radius of 2 of the center
+        grains.blast(bucket_center_x, bucket_center_y, 2, 20)
 
-            if distance < 2:  # Only affect grains within a certain radius
-                # Normalize the vector
-                if distance > 0:
-                    dx /= distance
-                    dy /= distance
-
-                # Apply a radial impulse (adjust magnitude as needed)
-                impulse_magnitude = 20 / (distance + 0.1)  # Reduce force with distance
-                impulse = (dx * impulse_magnitude, dy * impulse_magnitude)
-                grain.body.apply_impulse_at_world_point(impulse, grain.body.position)
+        # Burst of sugar and bucket pieces, for show only
+        if particles is not None:
+            particles.burst(bucket_center_x, bucket_center_y, BUCKET_BURST_PARTICLES // 2, 12, 'white')
+            particles.burst(bucket_center_x, bucket_center_y, BUCKET_BURST_PARTICLES // 2, 8, (144, 238, 144))
 
         # Remove the bucket walls
         self.space.remove(self.left_wall, self.right_wall, self.bottom_wall)
 
         self.exploded = True  # Mark the bucket as exploded
         
-    def draw(self, screen):
-        """
-        Draw the bucket with an open top on the Pygame screen.
-        """
-        if self.exploded:
-            return  # Don't draw if the bucket has exploded
-
-        color = (144, 238, 144)  # Light green color
-
-        # Helper function to convert Pymunk coordinates to Pygame coordinates
-        def to_pygame(p):
-            return int(p[0] * SCALE), int(HEIGHT - p[1] * SCALE)
-
-        # Draw the bucket edges
-        pg.draw.line(screen, color, to_pygame(self.left_wall.a), to_pygame(self.left_wall.b), 2)
-        pg.draw.line(screen, color, to_pygame(self.right_wall.a), to_pygame(self.right_wall.b), 2)
-        pg.draw.line(screen, color, to_pygame(self.bottom_wall.a), to_pygame(self.bottom_wall.b), 2)
-
     def count_reset(self):
         if not self.exploded:
             self.count = 0
         
-    def collect(self, sugar_grain):
+    def bounds(self):
         """
-        Check if a sugar grain is within the bucket bounds and, if so, increase the bucket's count.
-        
-        :param sugar_grain: The sugar grain to check.
+        Return the bucket's bounding box as (left, right, bottom, top) in physics units.
         """
-        if self.exploded:
-            return  # Don't count grains if the bucket has exploded
-
-        grain_pos = sugar_grain.body.position
-
-        # Get bucket boundaries
         left = self.left_wall.a[0]
         right = self.right_wall.a[0]
         bottom = self.bottom_wall.a[1]
         top = self.left_wall.b[1]
+        return left, right, bottom, top
 
-        # Check if the grain's position is within the bucket's bounding box
-        if left <= grain_pos.x <= right and bottom <= grain_pos.y <= top:
-            self.count += 1
-            return True  # Indicate that the grain was collected
+    def collect(self, grains):
+        """
+        Count the sugar grains within the bucket bounds and add them to the bucket's count.
+        
+        :param grains: The grain backend holding the game's sugar grains.
+        """
+        if self.exploded:
+            return  # Don't count grains if the bucket has exploded
 
-        return False  # Grain not collected
+        self.count += grains.count_in(self)
 
     def delete(self):
         if not self.exploded:
             # Remove the bucket walls
             self.space.remove(self.left_wall, self.right_wall, self.bottom_wall)
             self.exploded = True
+        if self.body.space is not None:
+            self.space.remove(self.body)
@@ -0,0 +1,65 @@
+#############################################################
+# Module Name: Sugar Pop Camera Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Camera that scrolls over levels larger than the screen
+#############################################################
+from settings import SCALE, WIDTH, HEIGHT, CAMERA_SMOOTHING
+
+class Camera:
+    def __init__(self, world_width, world_height):
+        """
+        Track which part of the world is on screen. The camera position is the
+        bottom-left corner of the screen in physics units.
+
+        :param world_width: Width of the world in pixels.
+        :param world_height: Height of the world in pixels.
+        """
+        self.width = WIDTH / SCALE
+        self.height = HEIGHT / SCALE
+        self.max_x = max(world_width / SCALE - self.width, 0)
+        self.max_y = max(world_height / SCALE - self.height, 0)
+        self.x = 0.0
+        self.y = 0.0
+        self.follow = True  # Follow the flow until the player pans by hand
+
+    def center_on(self, p):
+        """
+        Jump so a point in physics units is centered on screen.
+        """
+        self.x, self.y = self._clamp(p[0] - self.width / 2, p[1] - self.height / 2)
+
+    def update(self, target, dt):
+        """
+        Ease towards a point in physics units when following.
+
+        :param target: The point to keep centered, or None to stay put.
+        :param dt: The time step in seconds.
+        """
+        if not self.follow or target is None:
+            return
+        goal_x, goal_y = self._clamp(target[0] - self.width / 2, target[1] - self.height / 2)
+        blend = min(1.0, CAMERA_SMOOTHING * dt)
+        self.x += (goal_x - self.x) * blend
+        self.y += (goal_y - self.y) * blend
+
+    def pan(self, dx, dy):
+        """
+        Move the camera by hand, which stops it following the flow.
+
+        :param dx, dy: Distance to move in physics units.
+        """
+        self.follow = False
+        self.x, self.y = self._clamp(self.x + dx, self.y + dy)
+
+    def rect(self, margin=0):
+        """
+        Return the (left, bottom, right, top) rectangle on screen in physics units.
+
+        :param margin: Extra distance to add on every side.
+        """
+        return (self.x - margin, self.y - margin, self.x + self.width + margin, self.y + self.height + margin)
+
+    def _clamp(self, x, y):
+        return min(max(x, 0), self.max_x), min(max(y, 0), self.max_y)
@@ -0,0 +1,57 @@
+#############################################################
+# Module Name: Sugar Pop Checkpoint Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Space snapshot and restore for instant level restarts
+#############################################################
+import pickle
+
+# Game attributes that make up a restorable snapshot. The Pymunk space and
+# every entity that holds references into it are pickled together so the
+# restored entities point at the restored space's bodies and shapes.
+STATE_ATTRIBUTES = (
+    'space',
+    'grains',
+    'grains_per_drop',
+    'entities',
+    'level',
+    'current_level',
+    'level_complete',
+    'level_grain_dropping',
+    'level_spout_position',
+    'total_sugar_count',
+    'iter',
+    'scheduler',
+    'world_size',
+    'camera',
+)
+
+class Checkpoint:
+    def __init__(self, game):
+        """
+        Snapshot the physics space and the game-side entity state.
+
+        The snapshot is stored as pickled bytes, so one checkpoint can be
+        restored any number of times and each restore gets fresh objects.
+
+        :param game: The Game instance to snapshot.
+        """
+        state = {name: getattr(game, name) for name in STATE_ATTRIBUTES if hasattr(game, name)}
+        self.data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, game):
+        """
+        Replace the game's space and entities with the snapshotted ones in one step.
+
+        :param game: The Game instance to restore into.
+        """
+        state = pickle.loads(self.data)
+        for name, value in state.items():
+            setattr(game, name, value)
+
+    def size(self):
+        """
+        Return the size of the snapshot in bytes.
+        """
+        return len(self.data)
@@ -0,0 +1,66 @@
+#############################################################
+# Module Name: Sugar Pop Chunks Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Splits the world into chunks for simulation activation
+#############################################################
+from settings import SCALE, CHUNK_SIZE
+
+class ChunkGrid:
+    def __init__(self, world_width, world_height, chunk_size=CHUNK_SIZE):
+        """
+        Split the world into square chunks. Chunks are (column, row) pairs
+        counted from the bottom-left corner, like Pymunk coordinates.
+
+        :param world_width: Width of the world in pixels.
+        :param world_height: Height of the world in pixels.
+        :param chunk_size: Side of a chunk in pixels.
+        """
+        self.world_width = world_width
+        self.world_height = world_height
+        self.size = chunk_size / SCALE  # Side of a chunk in physics units
+        self.columns = max(1, -(-world_width // chunk_size))
+        self.rows = max(1, -(-world_height // chunk_size))
+
+    def all(self):
+        """
+        Return every chunk in the world.
+        """
+        return {(c, r) for c in range(self.columns) for r in range(self.rows)}
+
+    def chunk_at(self, p):
+        """
+        Return the chunk holding a point in physics units, clamped to the world.
+        """
+        column = min(max(int(p[0] // self.size), 0), self.columns - 1)
+        row = min(max(int(p[1] // self.size), 0), self.rows - 1)
+        return column, row
+
+    def chunks_in(self, rect):
+        """
+        Return the chunks overlapping a (left, bottom, right, top) rectangle in physics units.
+        """
+        left, bottom = self.chunk_at((rect[0], rect[1]))
+        right, top = self.chunk_at((rect[2], rect[3]))
+        return {(c, r) for c in range(left, right + 1) for r in range(bottom, top + 1)}
+
+    def neighbors(self, chunks):
+        """
+        Return the given chunks plus every chunk touching them.
+        """
+        grown = set()
+        for column, row in chunks:
+            for c in range(max(column - 1, 0), min(column + 2, self.columns)):
+                for r in range(max(row - 1, 0), min(row + 2, self.rows)):
+                    grown.add((c, r))
+        return grown
+
+    def bounds(self, chunks):
+        """
+        Return the (left, bottom, right, top) rectangle in physics units covering the chunks.
+        """
+        columns = [c for c, _ in chunks]
+        rows = [r for _, r in chunks]
+        return (min(columns) * self.size, min(rows) * self.size,
+                (max(columns) + 1) * self.size, (max(rows) + 1) * self.size)
@@ -7,7 +7,7 @@
 #############################################################
 import pygame as pg
 import pymunk
-from settings import SCALE, HEIGHT, WIDTH
+from settings import SCALE
 
 class DynamicItem:
     def __init__(self, space, color='red', friction=0.3, elasticity=0.5, thickness=0.2):
@@ -33,13 +33,10 @@ class DynamicItem:
     def add_vertex(self, x, y):
         """
         Add a new vertex and create a Segment between the last vertex and the new one.
-        """
-        # Convert the Pygame coordinates to Pymunk coordinates (Pymunk's Y-axis points upwards)
-        adjusted_x = x / SCALE
-        adjusted_y = (HEIGHT - y) / SCALE
 
-        # Add the new vertex with adjusted coordinates
-        new_vertex = (adjusted_x, adjusted_y)
+        :param x, y: The vertex in Pymunk coordinates (see View.to_world for mouse positions).
+        """
+        new_vertex = (x, y)
         
         if self.vertices:
             # Create a segment between the last vertex and the new vertex
@@ -61,21 +58,33 @@ class DynamicItem:
         """
         self.color = color
         
-    def draw(self, screen):
+    @classmethod
+    def draw_all(cls, items, screen, view):
         """
-        Draw the chain shape (edges) on the Pygame screen.
+        Draw every user-drawn line, working out each color and width only once.
+        """
+        styles = {}  # (color, thickness) -> (pg.Color, line width), shared by most lines
+        for item in items:
+            if len(item.vertices) < 2:
+                continue
+            style = styles.get((item.color, item.thickness))
+            if style is None:
+                style = styles[item.color, item.thickness] = (pg.Color(item.color), view.line_width(item.thickness * SCALE * 0.7))
+            pg.draw.lines(screen, style[0], False, [view.to_screen(v) for v in item.vertices], style[1])
+
+    def draw(self, screen, view):
         """
+        Draw the chain shape (edges) on the Pygame screen as one polyline.
+
+        :param view: The View mapping physics coordinates to the screen.
+        """
+        if len(self.vertices) < 2:
+            return  # Nothing to draw until there is a segment
+
         # Calculate the visual line width based on thickness
-        line_width = max(1, int(self.thickness * SCALE * 0.7))
-    
-        for i in range(len(self.vertices) - 1):
-            start_x = self.vertices[i][0] * SCALE
-            start_y = HEIGHT - self.vertices[i][1] * SCALE
-            end_x = self.vertices[i + 1][0] * SCALE
-            end_y = HEIGHT - self.vertices[i + 1][1] * SCALE
-            start = (start_x, start_y)
-            end = (end_x, end_y)
-            pg.draw.line(screen, pg.Color(self.color), start, end, line_width)
+        line_width = view.line_width(self.thickness * SCALE * 0.7)
+        points = [view.to_screen(v) for v in self.vertices]
+        pg.draw.lines(screen, pg.Color(self.color), False, points, line_width)
 
     def delete(self):
         """
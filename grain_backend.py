@@ -0,0 +1,261 @@
+#############################################################
+# Module Name: Sugar Pop Grain Backend Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Pluggable grain simulation backends for the sugar pop game
+#############################################################
+from abc import ABC, abstractmethod
+from math import sqrt
+import sugar_grain
+import chunks
+from settings import RES, REBIN_INTERVAL, ACTIVE_SPEED
+
+class GrainBackend(ABC):
+    """
+    Interface for everything the game does with sugar grains: dropping them
+    from the spout, stepping them, counting them in buckets, blasting them
+    away from exploding buckets and drawing them. A backend that misses one
+    of the abstract methods fails when it is built, not mid-level.
+    """
+    def __init__(self, space, world_size=RES):
+        """
+        :param space: The Pymunk space holding the level geometry.
+        :param world_size: Width and height of the world in pixels.
+        """
+        self.space = space
+        self.chunks = chunks.ChunkGrid(*world_size)
+        self.wanted = self.chunks.all()  # Chunks the game wants simulated
+        self.focus_point = None  # Mean position of the moving grains, for the camera
+
+    @abstractmethod
+    def __len__(self):
+        """
+        Return the number of grains dropped so far.
+        """
+
+    @abstractmethod
+    def drop(self, x, y, count=1):
+        """
+        Drop new grains at the spout.
+
+        :param x: X position of the spout in pixels.
+        :param y: Y position of the spout in pixels (Pymunk orientation, Y up).
+        :param count: How many grains to drop.
+        """
+
+    def activate(self, rect, points=()):
+        """
+        Ask for the chunks around a rectangle and some points to be simulated.
+        Chunks holding moving grains stay active too; everything else may be
+        frozen until it is needed again.
+
+        :param rect: The (left, bottom, right, top) rectangle in physics units, usually the camera's.
+        :param points: Extra points in physics units whose chunks must stay active, like the spout.
+        """
+        self.wanted = self.chunks.chunks_in(rect) | {self.chunks.chunk_at(p) for p in points}
+
+    def focus(self):
+        """
+        Return the point in physics units the flow is moving around, or None when nothing moves.
+        """
+        return self.focus_point
+
+    @abstractmethod
+    def state(self):
+        """
+        Return the positions and velocities of all grains, each as a sequence
+        of (x, y) pairs in physics units, for traces. Backends that track
+        single grains return them in the order they were dropped, so the same
+        row is the same grain from call to call.
+        """
+
+    @abstractmethod
+    def step(self, dt):
+        """
+        Advance the grains by one frame. Called right after the space is stepped.
+
+        :param dt: The time step in seconds.
+        """
+
+    @abstractmethod
+    def count_in(self, bucket):
+        """
+        Return how many grains are inside the bucket's bounds.
+
+        :param bucket: The bucket to count grains for.
+        """
+
+    @abstractmethod
+    def blast(self, x, y, radius, strength):
+        """
+        Push grains near a point outwards.
+
+        :param x, y: Center of the blast in physics units.
+        :param radius: Radius of the blast in physics units.
+        :param strength: Impulse scale of the blast.
+        """
+
+    @abstractmethod
+    def draw(self, screen, view):
+        """
+        Draw all grains on the Pygame screen.
+
+        :param view: The View mapping physics coordinates to the screen.
+        """
+
+    @abstractmethod
+    def delete(self):
+        """
+        Remove all grains.
+        """
+
+
+class PymunkGrainBackend(GrainBackend):
+    """
+    Every grain is a full Pymunk rigid body. Precise, but limited to a few
+    thousand grains.
+
+    Grains are binned by chunk. Grains in inactive chunks are frozen (taken
+    out of the space), so they cost nothing to step, and drawing, counting
+    and blasting only visit the chunks they touch.
+    """
+    def __init__(self, space, grain_options=None, world_size=RES):
+        """
+        :param space: The Pymunk space holding the level geometry.
+        :param grain_options: Keyword arguments for each sugar_grain (shape, radius, friction, ...).
+        :param world_size: Width and height of the world in pixels.
+        """
+        super().__init__(space, world_size)
+        self.grain_options = {'friction': 0.1}
+        self.grain_options.update(grain_options or {})
+        self.bins = {}  # Chunk -> list of grains in it
+        self.order = []  # Every grain in the order it was dropped
+        self.count = 0
+        self.active = self.chunks.all()  # Chunks being simulated
+        self.ticks = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def drop(self, x, y, count=1):
+        for i in range(count):
+            # Spread grains dropped together so they don't start overlapping
+            grain = sugar_grain.sugar_grain(self.space, x + 3 * i, y, **self.grain_options)
+            self.bins.setdefault(self.chunks.chunk_at(grain.body.position), []).append(grain)
+            self.order.append(grain)
+            self.count += 1
+
+    def state(self):
+        bodies = [grain.body for grain in self]
+        return [body.position for body in bodies], [body.velocity for body in bodies]
+
+    def step(self, dt):
+        self.ticks += 1
+        if self.ticks % REBIN_INTERVAL == 0:
+            self.rebin()
+
+    def rebin(self):
+        """
+        Move active grains to the chunk they are in now, then freeze the
+        chunks that are no longer needed and thaw the ones that are.
+        """
+        hot = set()  # Chunks holding moving grains
+        moved_into = set()
+        sum_x = sum_y = moving = 0
+        for chunk in list(self.active):
+            grains = self.bins.get(chunk)
+            if not grains:
+                continue
+            stay = []
+            for grain in grains:
+                body = grain.body
+                new_chunk = self.chunks.chunk_at(body.position)
+                if body.velocity.length > ACTIVE_SPEED:
+                    hot.add(new_chunk)
+                    sum_x += body.position.x
+                    sum_y += body.position.y
+                    moving += 1
+                if new_chunk == chunk:
+                    stay.append(grain)
+                else:
+                    self.bins.setdefault(new_chunk, []).append(grain)
+                    moved_into.add(new_chunk)
+            self.bins[chunk] = stay
+        self.focus_point = (sum_x / moving, sum_y / moving) if moving else None
+
+        active = self.wanted | self.chunks.neighbors(hot)
+        for chunk in (self.active | moved_into) - active:
+            for grain in self.bins.get(chunk, ()):
+                grain.freeze()
+        for chunk in active - self.active:
+            for grain in self.bins.get(chunk, ()):
+                grain.thaw()
+        self.active = active
+
+    def grains_in(self, rect):
+        """
+        Yield the grains in the chunks overlapping a (left, bottom, right, top) rectangle.
+        """
+        for chunk in self.chunks.chunks_in(rect):
+            yield from self.bins.get(chunk, ())
+
+    def count_in(self, bucket):
+        left, right, bottom, top = bucket.bounds()
+        count = 0
+        for grain in self.grains_in((left, bottom, right, top)):
+            grain_pos = grain.body.position
+            if left <= grain_pos.x <= right and bottom <= grain_pos.y <= top:
+                count += 1
+        return count
+
+    def blast(self, x, y, radius, strength):
+        for grain in self.grains_in((x - radius, y - radius, x + radius, y + radius)):
+            grain_pos = grain.body.position
+
+            # Calculate the vector from the blast center to the grain
+            dx = grain_pos.x - x
+            dy = grain_pos.y - y
+            distance = sqrt(dx**2 + dy**2)
+
+            if distance < radius:  # Only affect grains within the radius
+                # Normalize the vector
+                if distance > 0:
+                    dx /= distance
+                    dy /= distance
+
+                # Apply a radial impulse that weakens with distance
+                impulse_magnitude = strength / (distance + 0.1)
+                impulse = (dx * impulse_magnitude, dy * impulse_magnitude)
+                grain.body.apply_impulse_at_world_point(impulse, grain.body.position)
+
+    def draw(self, screen, view):
+        for grain in self.grains_in(view.visible_rect()):
+            grain.draw(screen, view)
+
+    def delete(self):
+        for grain in self:
+            grain.delete()
+        self.bins = {}
+        self.order = []
+        self.count = 0
+
+
+def create_grain_backend(name, space, grain_options=None, world_size=RES):
+    """
+    Build the grain backend a level asks for.
+
+    :param name: 'pymunk' for rigid body grains or 'sand' for the grid simulation.
+    :param space: The Pymunk space holding the level geometry.
+    :param grain_options: Per-grain settings for the Pymunk backend (see sugar_grain).
+    :param world_size: Width and height of the world in pixels.
+    """
+    if name == 'pymunk':
+        return PymunkGrainBackend(space, grain_options, world_size)
+    if name == 'sand':
+        import sand_grid  # Needs NumPy, so only import it when a level asks for it
+        return sand_grid.SandGridBackend(space, world_size)
+    raise ValueError(f"Unknown grain backend: {name}")
@@ -0,0 +1,186 @@
+#############################################################
+# Module Name: Sugar Pop Grain Trace Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Compact binary traces of grain motion and bucket counts
+#############################################################
+import argparse
+import queue
+import struct
+import threading
+import numpy as np
+from settings import TRACE_QUEUE_BYTES
+
+# File layout: a fixed size header, then fixed size float32 frames. Each frame
+# holds the simulation time, the number of grains in the world, the count of
+# every bucket and x, y, vx, vy for up to max_grains grains, padded with NaN.
+# Grains are stored in the order they were dropped; when the level has more
+# than max_grains, the same evenly spread grains are kept in every frame.
+MAGIC = b'SUGRTRC2'
+HEADER_FORMAT = '<8sIIIIIf'  # magic, level, grains in the level, max grains, buckets, steps per frame, step size
+HEADER_SIZE = 64
+
+def frame_dtype(max_grains, bucket_count):
+    """
+    Return the NumPy record type of one frame.
+    """
+    return np.dtype([
+        ('time', '<f4'),
+        ('grain_count', '<f4'),
+        ('buckets', '<f4', (bucket_count,)),
+        ('grains', '<f4', (max_grains, 4)),
+    ])
+
+def grain_ids(total_grains, max_grains):
+    """
+    Return the drop order indices of the grains a trace keeps: all of them,
+    or an even sample when the level has more than max_grains.
+    """
+    if total_grains <= max_grains:
+        return np.arange(total_grains)
+    return np.linspace(0, total_grains - 1, max_grains).astype(int)
+
+class TraceWriter:
+    def __init__(self, path, level, total_grains, max_grains, bucket_count, interval, dt):
+        """
+        Open a trace file and start the thread that writes it.
+
+        :param path: File to write.
+        :param level: Level number, stored in the header.
+        :param total_grains: Number of grains the level drops.
+        :param max_grains: Most grains a frame can hold; beyond that an even sample is kept.
+        :param bucket_count: Number of buckets in the level.
+        :param interval: Physics steps between frames.
+        :param dt: Length of a physics step in seconds.
+        """
+        self.interval = interval
+        self.steps = 0
+        self.ids = grain_ids(total_grains, max_grains)
+        self.dtype = frame_dtype(len(self.ids), bucket_count)
+        self.dropped = 0  # Frames skipped because the writer fell behind
+        self.file = open(path, 'wb')
+        header = struct.pack(HEADER_FORMAT, MAGIC, level, total_grains, len(self.ids), bucket_count, interval, dt)
+        self.file.write(header.ljust(HEADER_SIZE, b'\0'))
+
+        # Frames are written on a separate thread so disk stalls never reach the frame loop
+        self.frames = queue.Queue(maxsize=max(2, TRACE_QUEUE_BYTES // self.dtype.itemsize))
+        self.thread = threading.Thread(target=self._write_frames, daemon=True)
+        self.thread.start()
+
+    def record(self, time, grains, buckets):
+        """
+        Call once per physics step; queues a frame every interval steps. Never
+        blocks: when the writer is behind, the frame is dropped and counted instead.
+
+        :param time: Simulation time in seconds.
+        :param grains: The grain backend.
+        :param buckets: The level's buckets.
+        """
+        self.steps += 1
+        if self.steps % self.interval:
+            return
+        frame = np.empty((), self.dtype)
+        positions, velocities = grains.state()
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        velocities = np.asarray(velocities, dtype=np.float32).reshape(-1, 2)
+        total = len(positions)
+        # Only the kept grains dropped so far have rows yet
+        ids = self.ids[:np.searchsorted(self.ids, total)]
+        count = len(ids)
+        frame['time'] = time
+        frame['grain_count'] = total
+        frame['buckets'] = [bucket.count for bucket in buckets]
+        frame['grains'][:count, :2] = positions[ids]
+        frame['grains'][:count, 2:] = velocities[ids]
+        frame['grains'][count:] = np.nan
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        """
+        Write the frames still queued and close the file.
+        """
+        self.frames.put(None)
+        self.thread.join()
+        self.file.close()
+
+    def _write_frames(self):
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                return
+            self.file.write(frame.tobytes())
+
+class TraceReader:
+    def __init__(self, path):
+        """
+        Open a trace file for reading. Frames are memory mapped, so any frame
+        can be read without loading the rest of the file.
+
+        :param path: File written by TraceWriter.
+        """
+        with open(path, 'rb') as trace_file:
+            header = trace_file.read(HEADER_SIZE)
+        magic, self.level, self.total_grains, self.max_grains, self.bucket_count, self.interval, self.dt = \
+            struct.unpack_from(HEADER_FORMAT, header)
+        if magic != MAGIC:
+            raise ValueError(f"Not a grain trace: {path}")
+        self.ids = grain_ids(self.total_grains, self.max_grains)  # Drop order index of each grain row
+        self.dtype = frame_dtype(self.max_grains, self.bucket_count)
+
+        # A trace cut short mid-frame still reads up to its last whole frame
+        with open(path, 'rb') as trace_file:
+            trace_file.seek(0, 2)
+            frame_count = (trace_file.tell() - HEADER_SIZE) // self.dtype.itemsize
+        if frame_count:
+            self.frames = np.memmap(path, dtype=self.dtype, mode='r', offset=HEADER_SIZE, shape=(frame_count,))
+        else:
+            self.frames = np.zeros(0, dtype=self.dtype)  # Empty files can't be mapped
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        """
+        Return one frame, or a range of frames for a slice, as records.
+        """
+        return self.frames[index]
+
+    def times(self):
+        """
+        Return the simulation time of every frame.
+        """
+        return self.frames['time']
+
+    def bucket_counts(self):
+        """
+        Return a (frames, buckets) array with the bucket counts over time.
+        """
+        return self.frames['buckets']
+
+    def grains(self, index):
+        """
+        Return the (grains, 4) array of x, y, vx, vy in physics units at one
+        frame. Row i is the same grain in every frame, the one dropped at
+        position ids[i]; levels with more than max_grains grains give an even sample.
+        """
+        frame = self.frames[index]
+        return frame['grains'][:np.searchsorted(self.ids, int(frame['grain_count']))]
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize a Sugar Pop grain trace')
+    parser.add_argument('path', help='trace file to read')
+    args = parser.parse_args()
+
+    trace = TraceReader(args.path)
+    print(f'level {trace.level}: {len(trace)} frames, one every {trace.interval} steps, '
+          f'{trace.max_grains} of {trace.total_grains} grains, {trace.bucket_count} buckets')
+    if len(trace):
+        last = trace[-1]
+        print(f"last frame at {last['time']:.2f} s: {int(last['grain_count'])} grains, buckets {last['buckets'].astype(int).tolist()}")
+
+if __name__ == '__main__':
+    main()
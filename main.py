@@ -9,21 +9,50 @@
 import pygame as pg
 import pymunk  # Import Pymunk library
 import sys
+import os
+import argparse
 from settings import *
 import random
 import static_item
 import dynamic_item
-import sugar_grain
+import grain_backend
 import bucket
 import level
+import seesaw
+import registry
 import message_display
+import checkpoint
+import view
+import camera
+import scheduler
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, time_warp=TIME_WARP, unthrottled=False, trace_dir=None,
+                 threaded=THREADED_SOLVER, solver_threads=SOLVER_THREADS) -> None:
         pg.init()
         self.screen = pg.display.set_mode(RES)
         self.clock = pg.time.Clock()
+
+        # Set up the surface the world is drawn into before upscaling
+        self.view = view.View(RENDER_SCALE)
+        self.world_surface = pg.Surface(self.view.size) if self.view.size != RES else None
+        self.upscaled = None  # Full size copy of the world for targets in another pixel format
+
+        # The world can be larger than the screen; the camera picks what is shown
+        self.world_size = RES
+        self.camera = camera.Camera(*self.world_size)
         self.iter = 0
+
+        # Level flow runs on simulation time so it can go faster than real time
+        self.scheduler = scheduler.Scheduler()
+        self.time_warp = time_warp
+        self.unthrottled = unthrottled
+        self.time_budget = 0.0  # Simulation time owed but not yet stepped
+
+        # Optional grain traces, one file per run of a level
+        self.trace_dir = trace_dir
+        self.trace_runs = {}  # Level number -> traces started for it, so restarts get files of their own
+        self.trace = None
         
         # Initialize font for HUD
         self.font = pg.font.SysFont(None, 36)  # Default font, size 36
@@ -31,21 +60,37 @@ class Game:
         # Create a Pymunk space with gravity
         self.current_level = 3 # Start game at 0
         self.level_complete = False
-        self.space = pymunk.Space()
+        self.space = pymunk.Space(threaded=threaded)
+        if threaded:
+            self.space.threads = solver_threads
         self.space.gravity = (0, -10)  # Gravity pointing downwards in Pymunk's coordinate system
         # Iterations defaults to 10. Higher is more accurate collison detection
         self.space.iterations = 30 
 
-        self.drawing_lines = []
-        self.sugar_grains = []
-        self.buckets = []
-        self.statics = []
+        self.grains = grain_backend.PymunkGrainBackend(self.space)
+        self.grains_per_drop = 1
+
+        # Decorative particles need NumPy; the game runs without them if it's missing
+        try:
+            import particles
+            self.particles = particles.ParticleSystem()
+        except ImportError:
+            self.particles = None
+
+        # Entity kinds, in drawing order. The names match the level file keys.
+        self.entities = registry.Registry()
+        self.entities.register('buckets', bucket.Bucket)
+        self.entities.register('lines', dynamic_item.DynamicItem)
+        self.entities.register('statics', static_item.StaticItem)
+        self.entities.register('seesaws', seesaw.Seesaw)
         self.total_sugar_count = None
         self.level_spout_position = None
         self.level_grain_dropping = None
         self.mouse_down = False
         self.current_line = None
-        self.message_display = message_display.MessageDisplay(font_size=72)
+        self.level_start_checkpoint = None  # Snapshot taken when a level finishes loading
+        self.quick_checkpoint = None  # Snapshot taken on demand
+        self.message_display = message_display.MessageDisplay(font_size=72, clock=self.sim_time)
         
         # Load the intro image
         self.intro_image = pg.image.load("./images/SugarPop.png").convert()  # Load the intro image
@@ -53,22 +98,19 @@ class Game:
         scale_height = self.intro_image.get_height() * WIDTH / self.intro_image.get_width()
         self.intro_image = pg.transform.scale(self.intro_image, (WIDTH, int(scale_height)))  # Scale to screen resolution
         
-        pg.time.set_timer(LOAD_NEW_LEVEL, 5000)  # Load in 2 seconds
+        self.scheduler.set_timer(LOAD_NEW_LEVEL, 5)  # Load in 5 seconds
 
     def load_level(self, levelnumber=0):
         # Destroy any current game objects
-        for item in self.sugar_grains:
-            item.delete()  # Delete all sugar grains
-        for item in self.drawing_lines:
-            item.delete() 
-        for item in self.buckets:
-            item.delete() 
-        for item in self.statics:
-            item.delete() 
-        self.sugar_grains = []
-        self.drawing_lines = []  # Clear the list
-        self.buckets = []
-        self.statics = []
+        self.grains.delete()  # Delete all sugar grains
+        self.entities.clear()
+        if self.particles is not None:
+            self.particles.clear()
+        # A line still being drawn isn't in the registry yet
+        if self.current_line is not None:
+            self.current_line.delete()
+            self.current_line = None
+        self.mouse_down = False
  
         new_level = LEVEL_FILE_NAME.replace("X", str(levelnumber))
         self.level = level.Level(new_level)
@@ -79,128 +121,158 @@ class Game:
         else:  # Do final steps to start the level
             self.level_grain_dropping = False
             self.level_spout_position = (self.level.data['spout_x'], self.level.data['spout_y'])
+            self.world_size = (self.level.data.get('world_width', WIDTH), self.level.data.get('world_height', HEIGHT))
             self.build_main_walls()
 
-            # Load buckets
-            for nb in self.level.data['buckets']:
-                self.buckets.append(bucket.Bucket(self.space, nb['x'], nb['y'], nb['width'], nb['height'], nb['needed_sugar']))
-            # Load static items
-            for nb in self.level.data['statics']:
-                self.statics.append(static_item.StaticItem(self.space, nb['x1'], nb['y1'], nb['x2'], nb['y2'], nb['color'], nb['line_width'], nb['friction'], nb['restitution']))
+            # Start the camera on the spout
+            self.camera = camera.Camera(*self.world_size)
+            self.camera.center_on(self.spout_point())
+
+            # Pick how this level simulates its grains
+            self.grains = grain_backend.create_grain_backend(self.level.data.get('grain_backend', 'pymunk'), self.space, self.level.data.get('grain'), self.world_size)
+            self.grains_per_drop = self.level.data.get('grains_per_drop', 1)
+
+            # Load buckets, static items, seesaws and any other declared entities
+            self.entities.load(self.space, self.level.data)
             self.total_sugar_count = self.level.data['number_sugar_grains']
-            pg.time.set_timer(START_FLOW, 5 * 1000)  # 5 seconds
+            self.scheduler.set_timer(START_FLOW, 5)  # 5 seconds
             self.message_display.show_message("Level Up", 10)
             self.level_complete = False
             
 
         
-            self.create_seesaw()
-
             self.total_sugar_count = self.level.data ['number_sugar_grains']
-            pg.time.set_timer (START_FLOW, 5*1000)
+            self.scheduler.set_timer (START_FLOW, 5)
             self.message_display.show_message ("level up", 10)
             self.level_complete = False
-            return True
-
-    # def create_seesaw (self):
-    #     """"make a dynamic seesaw that is able to rotate""" 
-    #     #body of the seesaw
-    #     seesaw_body = pymunk.Body (10, pymunk.moment_for_box(10, (224,10))) 
-    #     seesaw_body.position = (512, 300)
-
-    #     #shape of the seesaw
-    #     seesaw_shape = pymunk.Poly.create_box(seesaw_body, (224, 10))
-    #     seesaw_shape.friction = 0.8
-    #     seesaw_shape.color = pg.color ("brown")
-    #     self.space.add(seesaw_body, seesaw_shape)
-
-    #     #create a static center point for the seesaw
-    #     pivot_joint = pymunk.Pinjoint (self.space.static_body, seesaw_body, (512,300))
-    #     self.space.add (pivot_joint)
-
-    #     #add rotational spring to stabilize the seesaw
-    #     spring = pymunk.DampedRotarySpring (self.space.static_body, seesaw_body, 0.0, 500.0, 50.0)
-    #     self.space.add(spring)
-
-    #     #store the components for drawing
-    #     self.seesaw_body = seesaw_body
-    #     self.seesaw_shape = seesaw_shape          
-
-    def create_seesaw (self, pivot_x, pivot_y, width, plank_lenth, color):
-        #pivot
-        pivot_body = pymunk.Body (body_type = pymunk.Body.STATIC)
-        pivot_body.position = pivot_x, pivot_y
-        pivot_shape = pymunk.Circle (pivot_body, radius = 5)
-        pivot_shape.color = pg.color ("red")
-        self.space.add (pivot_body, pivot_shape)
-
-        #create the seesaw plank
-        plank_body = pymunk.Body()
-        plank_body.position = pivot_x, pivot_y
-        plank_shape = pymunk.segment(plank_body, (-plank_length / 2, 0), (plank_length / 2, 0), width)
-        plank_shape.density = 1
-        plank_shape.elasticity = 0.5
-        plank_shape.friction = 0.3
-        self.space.add (plank_body, plank_shape)
-
-        #pivot_joint
-        pivot_joint = pymunk.PivotJoint(pivot_body, plank_body, (pivot_x, pivot_y))
-        self.space.add(pivot_joint)
-
-        # Store the seesaw components for drawing
-        self.seesaw = {
-        "pivot": pivot_shape,
-        "plank_body": plank_body,
-        "plank_shape": plank_shape,
-        "color": color,
-    }
 
+            # Snapshot the freshly loaded level so restarts skip the rebuild
+            self.level_start_checkpoint = checkpoint.Checkpoint(self)
 
+            if self.trace_dir:
+                self.start_trace(levelnumber)
+            return True
 
+    def start_trace(self, levelnumber):
+        '''Start a grain trace file for a level, closing the previous one'''
+        import grain_trace  # Needs NumPy, so only import it when tracing
+        self.stop_trace()
+        os.makedirs(self.trace_dir, exist_ok=True)
+        run = self.trace_runs[levelnumber] = self.trace_runs.get(levelnumber, 0) + 1
+        name = f'level{levelnumber}.trace' if run == 1 else f'level{levelnumber}-{run}.trace'
+        path = os.path.join(self.trace_dir, name)
+        self.trace = grain_trace.TraceWriter(path, levelnumber, self.total_sugar_count, TRACE_MAX_GRAINS,
+                                             len(self.entities.of('buckets')), TRACE_INTERVAL, MAX_TIME_STEP)
+
+    def stop_trace(self):
+        '''Finish writing the current grain trace, if any'''
+        if self.trace:
+            self.trace.close()
+            self.trace = None
+
+    def save_checkpoint(self):
+        '''Snapshot the space and game state at the current frame'''
+        return checkpoint.Checkpoint(self)
+
+    def restore_checkpoint(self, snapshot):
+        '''Restore a snapshot taken by save_checkpoint or at level start'''
+        if snapshot is None:
+            return False
+        # Any stroke in progress belongs to the space being replaced
+        self.current_line = None
+        self.mouse_down = False
+        if self.particles is not None:
+            self.particles.clear()
+        # The scheduler is part of the snapshot, so pending level events come back too
+        snapshot.restore(self)
+        # The restored run starts over in time, so it gets a trace of its own
+        if self.trace_dir:
+            self.start_trace(self.current_level)
+        return True
+
+    def restart_level(self):
+        '''Instantly restart the current level from its level-start checkpoint'''
+        if self.restore_checkpoint(self.level_start_checkpoint):
+            self.message_display.show_message(f"Level {self.current_level} Restart", 2)
+
+    def spout_point(self):
+        '''Return the spout position in physics units'''
+        return self.level_spout_position[0] / SCALE, self.level_spout_position[1] / SCALE
 
     def build_main_walls(self):
-        '''Build the walls, ceiling, and floor of the screen'''
+        '''Build the walls, ceiling, and floor of the world'''
+        world_width, world_height = self.world_size
         # Floor
-        floor = static_item.StaticItem(self.space, 0, 0, WIDTH, 0, 'red', 5)
-        self.statics.append(floor)
+        floor = static_item.StaticItem(self.space, 0, 0, world_width, 0, 'red', 5)
+        self.entities.add('statics', floor)
         # Left Wall
-        left_wall = static_item.StaticItem(self.space, 0, 0, 0, HEIGHT, 'red')
-        self.statics.append(left_wall)
+        left_wall = static_item.StaticItem(self.space, 0, 0, 0, world_height, 'red')
+        self.entities.add('statics', left_wall)
         # Right Wall
-        right_wall = static_item.StaticItem(self.space, WIDTH, 0, WIDTH, HEIGHT, 'red')
-        self.statics.append(right_wall)
+        right_wall = static_item.StaticItem(self.space, world_width, 0, world_width, world_height, 'red')
+        self.entities.add('statics', right_wall)
         # Ceiling
-        ceiling = static_item.StaticItem(self.space, 0, HEIGHT, WIDTH, HEIGHT, 'red')
-        self.statics.append(ceiling)
+        ceiling = static_item.StaticItem(self.space, 0, world_height, world_width, world_height, 'red')
+        self.entities.add('statics', ceiling)
     
     def check_all_buckets_exploded(self):
         """
         Check if all buckets have exploded.
         """
-        return all(bucket.exploded for bucket in self.buckets)
+        return all(bucket.exploded for bucket in self.entities.of('buckets'))
+
+    def sim_time(self):
+        '''Return the simulation time in seconds'''
+        return self.scheduler.time
 
     def update(self):
         '''Update the program physics'''
         # if self.is_paused:
         #     return
 
+        if self.unthrottled:
+            # Run as fast as possible with a fixed number of ticks per frame
+            self.clock.tick()
+            ticks = UNTHROTTLED_TICKS_PER_FRAME
+        else:
+            # Calculate time since last frame
+            delta_time = self.clock.tick(FPS) / 1000.0  # Convert milliseconds to seconds
+
+            # Cap delta_time so a stall doesn't turn into a burst of catch-up ticks
+            self.time_budget += min(delta_time, MAX_FRAME_TIME) * self.time_warp
+            ticks = int(self.time_budget / MAX_TIME_STEP)
+            self.time_budget -= ticks * MAX_TIME_STEP
+
+        # Step the simulation in fixed ticks so every speed sees the same events
+        for _ in range(ticks):
+            self.tick()
+
+        pg.display.set_caption(f'fps: {self.clock.get_fps():.1f}')
+
+    def tick(self):
+        '''Advance the simulation by one fixed time step'''
         # Keep an overall iterator
         self.iter += 1
-        
-        # Calculate time since last frame
-        delta_time = self.clock.tick(FPS) / 1000.0  # Convert milliseconds to seconds
-
-        # Cap delta_time to prevent instability from large time steps
-        time_step = min(delta_time, MAX_TIME_STEP)
 
-        # Step the physics simulation forward with the calculated time_step
-        self.space.step(time_step)
+        # Follow the flow, and only simulate the chunks around the camera and the spout
+        if self.level_spout_position:
+            self.camera.update(self.grains.focus() or self.spout_point(), MAX_TIME_STEP)
+            self.grains.activate(self.camera.rect(CHUNK_MARGIN * CHUNK_SIZE / SCALE), [self.spout_point()])
+
+        # Step the physics simulation forward
+        self.space.step(MAX_TIME_STEP)
+        self.grains.step(MAX_TIME_STEP)
+        self.entities.update(MAX_TIME_STEP)
+        if self.particles is not None:
+            self.particles.update(MAX_TIME_STEP)
+
+        # Fire any level events that came due
+        for event_type in self.scheduler.advance(MAX_TIME_STEP):
+            self.handle_game_event(event_type)
         
         # Update our game counter
         if self.iter == 60:
             self.iter = 0
-
-        pg.display.set_caption(f'fps: {self.clock.get_fps():.1f}')
         
         # Only do the following every 20 frames for less system stress
         if self.iter % 20 == 0:
@@ -209,93 +281,103 @@ class Game:
             
             # Calculate buckets count by counting each grain's position
             # First, explode or reset the counter on each bucket
-            for bucket in self.buckets:
+            for bucket in self.entities.of('buckets'):
                 if bucket.count >= bucket.needed_sugar:
-                    bucket.explode(self.sugar_grains)
+                    bucket.explode(self.grains, self.particles)
                     # If all the buckets are gone, level up!
                     if not self.level_complete and self.check_all_buckets_exploded():
                         self.level_complete = True
+                        self.celebrate()
                         self.message_display.show_message("Level Complete!", 2)
-                        pg.time.set_timer(LOAD_NEW_LEVEL, 2000)  # Schedule next level load
+                        self.scheduler.set_timer(LOAD_NEW_LEVEL, 2)  # Schedule next level load
                 else:
                     bucket.count_reset()
             # Count the grains in the un-exploded buckets
-            for grain in self.sugar_grains:
-                for bucket in self.buckets:
-                    bucket.collect(grain)
+            for bucket in self.entities.of('buckets'):
+                bucket.collect(self.grains)
                 
             # Drop sugar if needed
             if self.level_grain_dropping:
                 # Create new sugar to drop
-                new_sugar = sugar_grain.sugar_grain(self.space, self.level_spout_position[0], self.level_spout_position[1], 0.1)
-                self.sugar_grains.append(new_sugar)
+                remaining = self.total_sugar_count - len(self.grains)
+                self.grains.drop(self.level_spout_position[0], self.level_spout_position[1], min(self.grains_per_drop, remaining))
                 # Check if it's time to stop
-                if len(self.sugar_grains) >= self.total_sugar_count:
+                if len(self.grains) >= self.total_sugar_count:
                     self.level_grain_dropping = False
 
-    def draw_hud(self):
+        if self.trace:
+            self.trace.record(self.sim_time(), self.grains, self.entities.of('buckets'))
+
+    def celebrate(self):
+        '''Launch fountains of particles across the bottom of the screen'''
+        if self.particles is None:
+            return
+        left, bottom, right, top = self.camera.rect()
+        colors = ('white', 'gold', 'hotpink', 'deepskyblue', 'lightgreen')
+        for i, color in enumerate(colors):
+            x = left + (right - left) * (i + 1) / (len(colors) + 1)
+            self.particles.burst(x, bottom, LEVEL_COMPLETE_PARTICLES // len(colors), 20, color, 2.5, upward=True)
+
+    def upscale_world(self, screen):
+        '''Scale the reduced resolution world up onto a surface'''
+        world = self.world_surface
+        if screen.get_bitsize() == world.get_bitsize() and screen.get_masks() == world.get_masks():
+            pg.transform.scale(world, screen.get_size(), screen)
+            return
+        # scale() copies raw pixels, so other formats (like export frames)
+        # are scaled in the world's format and then converted by a blit
+        if self.upscaled is None or self.upscaled.get_size() != screen.get_size():
+            self.upscaled = pg.Surface(screen.get_size(), 0, world)
+        pg.transform.scale(world, screen.get_size(), self.upscaled)
+        screen.blit(self.upscaled, (0, 0))
+
+    def draw_hud(self, screen):
         """Draw the HUD displaying the number of grains."""
         # Prepare the text surface
         if self.total_sugar_count:
-            text_surface = self.font.render(f'{self.total_sugar_count - len(self.sugar_grains)}', True, (255, 255, 255))
+            text_surface = self.font.render(f'{self.total_sugar_count - len(self.grains)}', True, (255, 255, 255))
             # Draw the text surface on the screen
-            self.screen.blit(text_surface, (10, 10))  # Position at top-left corner
-
-    def draw_seesaw(self, screen):
-        if hasattr (self, 'seesaw') and self.seesaw:
-            #pivot
-            pivot_pos = self.seesaw ['pivot'].body.position
-            pg.draw.circle (screen, (255,0,0), (int (pivot_pos.x), HEIGHT - int(pivot_pos.y)), 5)
+            screen.blit(text_surface, (10, 10))  # Position at top-left corner
 
-            #draw plank
-            body = self.seesaw ['plank_body']
-            shape = self.seesaw ['plank_shape']
-            start = body.position + shape.a.rotated (body.angle)
-            end = body.position + shape.b.roteted(body.angle)
-            pg.draw.line (screen, self.seesaw ['color'], (start.x, HEIGHT - start.y), (end.x, HEIGHT - end.y), 5)
+    def draw(self):
+        '''Draw the overall game and show it in the window'''
+        self.render(self.screen)
 
+        # Update the display
+        pg.display.update()
 
+    def render(self, screen):
+        '''Render the overall game onto a surface. Should call individual item draw() methods'''
+        # The world goes into the reduced resolution surface when one is set
+        world = self.world_surface or screen
+        # Snap the camera to whole pixels so cached layers line up with everything drawn live
+        ppm = self.view.pixels_per_meter
+        self.view.origin = (round(self.camera.x * ppm) / ppm, round(self.camera.y * ppm) / ppm)
 
-    def draw(self):
-        '''Draw the overall game. Should call individual item draw() methods'''
         # Clear the screen
-        self.screen.fill('black')
-
-        # Only show the intro screen if we haven't loaded a level yet
-        if self.intro_image:
-            self.screen.blit(self.intro_image, (0, 0))  # Draw the intro image
+        world.fill('black')
     
-        for bucket in self.buckets:
-            bucket.draw(self.screen)
+        # Draw the sugar grains
+        self.grains.draw(world, self.view)
 
-        # Draw each sugar grain
-        for grain in self.sugar_grains:
-            grain.draw(self.screen)
+        # Draw buckets, lines, statics and seesaws one kind at a time
+        self.entities.draw(world, self.view)
 
         # Draw the current dynamic line
         if self.current_line is not None:
-            self.current_line.draw(self.screen)
-        
-        # Draw the user-drawn lines
-        for line in self.drawing_lines:
-            line.draw(self.screen)
-            
-        # Draw any static items
-        for static in self.statics:
-            static.draw(self.screen)
-
-        # #draw the seesaw
-        # if hasattr(self, 'seesaw_body') and hasattr (self, 'seesaw_shape'):
-        #     #get the seesaw endpoints
-        #     body = self.seesaw_body
-        #     shape = self.seesaw_shape
-        #     vertices = shape.get_vertices()
-        #     transformed_vertices = [body.local_to_world (v) for v in vertices]
-        #     pg.draw.polygon (
-        #         self.screen,
-        #         shape.color,
-        #         [(v.x, HEIGHT - v.y) for v in transformed_vertices]
-        #     )
+            self.current_line.draw(world, self.view)
+
+        # Draw the decorative particles on top of the world
+        if self.particles is not None:
+            self.particles.draw(world, self.view)
+
+        # Upscale the world to the window in one pass
+        if self.world_surface:
+            self.upscale_world(screen)
+
+        # Only show the intro screen if we haven't loaded a level yet
+        if self.intro_image:
+            screen.blit(self.intro_image, (0, 0))  # Draw the intro image
 
         # # Draw the nozzle (Remember to subtract y from the height)
         # if self.level_spout_position:
@@ -308,38 +390,16 @@ class Game:
         #     )
         
         # Draw the heads-up display
-        self.draw_hud()
-
-        #draw the seesaw
-        self.draw_seesaw(self.screen)
-        
+        self.draw_hud(screen)
 
         # Show any messages needed        
-        self.message_display.draw(self.screen)
-
-        # Update the display
-        pg.display.update()
-
-    # def draw_seesaw(self, screen):
-    #     if hasattr (self, 'seesaw') and self.seesaw:
-    #         #pivot
-    #         pivot_pos = self.seesaw ['pivot'].body.position
-    #         pg.draw.circle (screen, (255,0,0), (int (pivot_pos.x), HEIGHT - int(pivot_pos.y)), 5)
-
-    #         #draw plank
-    #         body = self.seesaw ['plank_body']
-    #         shape = self.seesaw ['plank_shape']
-    #         start = body.position + shape.a.rotated (body.angle)
-    #         end = body.position + shape.b.roteted(body.angle)
-    #         pg.draw.line (screen, self.seesaw ['color'], (start.x, HEIGHT - start.y), (end.x, HEIGHT - end.y), 5)
-
-
-
+        self.message_display.draw(screen)
 
     def check_events(self):
         '''Check for keyboard and mouse events'''
         for event in pg.event.get():
-            if event.type == EXIT_APP or event.type == pg.QUIT or (event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE):
+            if event.type == pg.QUIT or (event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE):
+                self.stop_trace()
                 pg.quit()
                 sys.exit()
 
@@ -347,17 +407,36 @@ class Game:
             elif event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE:
                 self.is_paused = not self.is_paused
 
+            # Restart the level or save/restore a quick checkpoint
+            elif event.type == pg.KEYDOWN and event.key == pg.K_r:
+                self.restart_level()
+            elif event.type == pg.KEYDOWN and event.key == pg.K_F5:
+                self.quick_checkpoint = self.save_checkpoint()
+                self.message_display.show_message("Checkpoint Saved", 1)
+            elif event.type == pg.KEYDOWN and event.key == pg.K_F9:
+                if self.restore_checkpoint(self.quick_checkpoint):
+                    self.message_display.show_message("Checkpoint Restored", 1)
+
+            # Pan the camera by hand, or go back to following the flow
+            elif event.type == pg.KEYDOWN and event.key in (pg.K_LEFT, pg.K_RIGHT, pg.K_UP, pg.K_DOWN):
+                step = CAMERA_PAN_STEP / SCALE
+                dx = {pg.K_LEFT: -step, pg.K_RIGHT: step}.get(event.key, 0)
+                dy = {pg.K_DOWN: -step, pg.K_UP: step}.get(event.key, 0)
+                self.camera.pan(dx, dy)
+            elif event.type == pg.KEYDOWN and event.key == pg.K_f:
+                self.camera.follow = True
+
             elif event.type == pg.MOUSEBUTTONDOWN:
                 self.mouse_down = True
                 # Get mouse position and start a new dynamic line
                 mouse_x, mouse_y = pg.mouse.get_pos()  
                 self.current_line = dynamic_item.DynamicItem(self.space, 'blue')
-                self.current_line.add_vertex(mouse_x, mouse_y)
+                self.current_line.add_vertex(*self.view.to_world(mouse_x, mouse_y))
                 
             elif event.type == pg.MOUSEBUTTONUP:
                 self.mouse_down = False
                 if self.current_line:
-                    self.drawing_lines.append(self.current_line)
+                    self.entities.add('lines', self.current_line)
                     self.current_line = None
                 
             elif event.type == pg.MOUSEMOTION and self.mouse_down:
@@ -366,22 +445,26 @@ class Game:
                 if mouse_x == 0 or mouse_x == WIDTH or mouse_y == 0 or mouse_y == HEIGHT:
                     self.mouse_down = False
                 if self.current_line and self.iter % 10 == 0:
-                    self.current_line.add_vertex(mouse_x, mouse_y)
+                    self.current_line.add_vertex(*self.view.to_world(mouse_x, mouse_y))
+
+    def handle_game_event(self, event_type):
+        '''Handle a level event fired by the scheduler'''
+        if event_type == EXIT_APP:
+            self.stop_trace()
+            pg.quit()
+            sys.exit()
 
-            elif event.type == START_FLOW:
-                self.level_grain_dropping = True
-                # Disable the timer after the first trigger
-                pg.time.set_timer(START_FLOW, 0)
+        elif event_type == START_FLOW:
+            self.level_grain_dropping = True
                 
-            elif event.type == LOAD_NEW_LEVEL:
-                pg.time.set_timer(LOAD_NEW_LEVEL, 0)  # Clear the timer
-                self.intro_image = None
-                self.current_level += 1
-                if not self.load_level(self.current_level):
-                    self.message_display.show_message("You Win!", 5)  # End of game message
-                    pg.time.set_timer(EXIT_APP, 5000)  # Quit game after 5 seconds
-                else:
-                    self.message_display.show_message(f"Level {self.current_level} Start!", 2)
+        elif event_type == LOAD_NEW_LEVEL:
+            self.intro_image = None
+            self.current_level += 1
+            if not self.load_level(self.current_level):
+                self.message_display.show_message("You Win!", 5)  # End of game message
+                self.scheduler.set_timer(EXIT_APP, 5)  # Quit game after 5 seconds
+            else:
+                self.message_display.show_message(f"Level {self.current_level} Start!", 2)
                     
     def run(self):
         '''Run the main game loop'''
@@ -391,7 +474,22 @@ class Game:
             self.draw()
 
 def main():
-    game = Game()
+    parser = argparse.ArgumentParser(description='Sugar Pop')
+    parser.add_argument('--time-warp', type=float, default=TIME_WARP, help='simulation seconds per wall-clock second')
+    parser.add_argument('--unthrottled', action='store_true', help='run the simulation as fast as possible')
+    parser.add_argument('--headless', action='store_true', help='run without opening a window')
+    parser.add_argument('--trace', metavar='DIR', help='write a grain trace for each level into DIR; restarts go to levelN-2.trace and so on')
+    parser.add_argument('--solver-threads', type=int, choices=SOLVER_THREAD_COUNTS,
+                        help='use the threaded physics solver with this many threads')
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'  # Must be set before pygame initializes the display
+    threaded, solver_threads = THREADED_SOLVER, SOLVER_THREADS
+    if args.solver_threads is not None:
+        threaded, solver_threads = args.solver_threads > 1, args.solver_threads
+    game = Game(time_warp=args.time_warp, unthrottled=args.unthrottled, trace_dir=args.trace,
+                threaded=threaded, solver_threads=solver_threads)
     game.run()
 
 if __name__ == '__main__':
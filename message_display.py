@@ -9,7 +9,7 @@ import pygame as pg
 import time
 
 class MessageDisplay:
-    def __init__(self, font_name=None, font_size=36, color=(255, 255, 255)):
+    def __init__(self, font_name=None, font_size=36, color=(255, 255, 255), clock=time.time):
         """
         Initialize the MessageDisplay class.
         
@@ -17,9 +17,11 @@ class MessageDisplay:
         :param font_name: The name of the font (default is None, which uses the default font).
         :param font_size: The size of the font.
         :param color: The color of the text (default is white).
+        :param clock: Function returning the current time in seconds (default is wall-clock time).
         """
         self.font = pg.font.SysFont(font_name, font_size)
         self.color = color
+        self.clock = clock
         self.message = None
         self.display_until = 0
 
@@ -31,13 +33,13 @@ class MessageDisplay:
         :param duration: The number of seconds to display the text.
         """
         self.message = text
-        self.display_until = time.time() + duration
+        self.display_until = self.clock() + duration
 
     def update(self):
         """
         Update the message display. If the timer expires, clear the message.
         """
-        if self.message and time.time() > self.display_until:
+        if self.message and self.clock() > self.display_until:
             self.message = None
 
     def draw(self, screen):
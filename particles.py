@@ -0,0 +1,112 @@
+#############################################################
+# Module Name: Sugar Pop Particles Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Decorative particle effects kept in NumPy arrays, outside the physics space
+#############################################################
+import numpy as np
+import pygame as pg
+from settings import PARTICLE_CAPACITY, PARTICLE_GRAVITY, PARTICLE_LIFETIME, PARTICLE_SIZE
+
+class ParticleSystem:
+    def __init__(self, capacity=PARTICLE_CAPACITY, seed=0):
+        """
+        Purely visual particles. They never touch the Pymunk space, so bursts
+        of thousands cost a few array operations per frame. Live particles are
+        kept packed at the front of the arrays.
+
+        :param capacity: Most particles alive at once; bursts beyond it are cut short.
+        :param seed: Seed for the random burst directions.
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.positions = np.zeros((capacity, 2), dtype=np.float32)  # Physics units
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)  # Seconds left
+        self.lifetime = np.ones(capacity, dtype=np.float32)  # Seconds at spawn, for fading
+        self.colors = np.zeros((capacity, 3), dtype=np.uint8)
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.count
+
+    def burst(self, x, y, count, speed, color, lifetime=PARTICLE_LIFETIME, upward=False):
+        """
+        Spawn particles flying out from a point.
+
+        :param x, y: Center of the burst in physics units.
+        :param count: Number of particles.
+        :param speed: Fastest launch speed in physics units per second.
+        :param color: Color of the particles; each one gets a slightly different shade.
+        :param lifetime: Longest time a particle lives in seconds.
+        :param upward: Only launch into the upper half, like a fountain.
+        """
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        new = slice(self.count, self.count + count)
+        angle = self.rng.uniform(0, np.pi if upward else 2 * np.pi, count)
+        launch = self.rng.uniform(0.2, 1.0, count) * speed
+        self.positions[new] = (x, y)
+        self.velocities[new, 0] = np.cos(angle) * launch
+        self.velocities[new, 1] = np.sin(angle) * launch
+        self.lifetime[new] = self.rng.uniform(0.5, 1.0, count) * lifetime
+        self.life[new] = self.lifetime[new]
+        shade = self.rng.uniform(0.7, 1.0, (count, 1))
+        self.colors[new] = np.asarray(pg.Color(color)[:3]) * shade
+        self.count += count
+
+    def update(self, dt):
+        """
+        Move every particle under gravity and drop the ones that have expired.
+
+        :param dt: The time step in seconds.
+        """
+        if not self.count:
+            return
+        live = slice(0, self.count)
+        self.velocities[live, 1] += PARTICLE_GRAVITY * dt
+        self.positions[live] += self.velocities[live] * dt
+        self.life[live] -= dt
+
+        # Pack the survivors back at the front
+        keep = np.flatnonzero(self.life[live] > 0)
+        if len(keep) < self.count:
+            for array in (self.positions, self.velocities, self.life, self.lifetime, self.colors):
+                array[:len(keep)] = array[keep]
+            self.count = len(keep)
+
+    def draw(self, screen, view):
+        """
+        Draw every particle in one pass by writing straight into the surface's pixels.
+
+        :param view: The View mapping physics coordinates to the screen.
+        """
+        if not self.count:
+            return
+        live = slice(0, self.count)
+        size = view.line_width(PARTICLE_SIZE)
+        xs = ((self.positions[live, 0] - view.origin[0]) * view.pixels_per_meter).astype(np.int32)
+        ys = (view.height - (self.positions[live, 1] - view.origin[1]) * view.pixels_per_meter).astype(np.int32)
+        width, height = screen.get_size()
+        shown = (xs >= 0) & (xs <= width - size) & (ys >= 0) & (ys <= height - size)
+        if not shown.any():
+            return
+        xs, ys = xs[shown], ys[shown]
+
+        # Fade out over the last part of each particle's life
+        fade = np.clip(self.life[live][shown] / self.lifetime[live][shown] * 2, 0, 1)
+        colors = (self.colors[live][shown] * fade[:, None]).astype(np.uint8)
+
+        pixels = pg.surfarray.pixels3d(screen)
+        for dx in range(size):
+            for dy in range(size):
+                pixels[xs + dx, ys + dy] = colors
+        del pixels  # Unlock the surface
+
+    def clear(self):
+        """
+        Remove all particles.
+        """
+        self.count = 0
@@ -0,0 +1,87 @@
+#############################################################
+# Module Name: Sugar Pop Registry Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Entity registry with batched update and draw passes
+#############################################################
+
+class Registry:
+    def __init__(self):
+        """
+        Store game entities grouped by kind. Each kind is backed by an entity
+        class whose classmethods work on the whole list at once:
+
+        - from_level(space, data): build one entity from its level JSON entry
+          (optional; kinds without it are only added at runtime).
+        - draw_all(items, screen, view): draw every entity of the kind.
+        - update_all(items, dt): step every entity of the kind (optional).
+
+        Kinds are drawn in the order they were registered.
+        """
+        self.classes = {}  # Kind name -> entity class
+        self.entities = {}  # Kind name -> list of entities
+        self.updaters = []  # Kinds that have an update pass
+
+    def register(self, kind, entity_class):
+        """
+        Add a kind of entity. The kind name is also its key in the level JSON.
+
+        :param kind: Name of the kind, such as 'buckets'.
+        :param entity_class: The class implementing the kind's batched passes.
+        """
+        self.classes[kind] = entity_class
+        self.entities.setdefault(kind, [])
+        if hasattr(entity_class, 'update_all'):
+            self.updaters.append(kind)
+
+    def add(self, kind, entity):
+        """
+        Add an entity to its kind and return it.
+        """
+        self.entities[kind].append(entity)
+        return entity
+
+    def of(self, kind):
+        """
+        Return the list of entities of one kind.
+        """
+        return self.entities[kind]
+
+    def load(self, space, level_data):
+        """
+        Create the entities declared in a level for every kind that can be loaded.
+
+        :param space: The Pymunk space to build the entities in.
+        :param level_data: The level's JSON data.
+        """
+        for kind, entity_class in self.classes.items():
+            if hasattr(entity_class, 'from_level'):
+                for data in level_data.get(kind, []):
+                    self.add(kind, entity_class.from_level(space, data))
+
+    def update(self, dt):
+        """
+        Run the update pass of each kind that has one.
+        """
+        for kind in self.updaters:
+            items = self.entities[kind]
+            if items:
+                self.classes[kind].update_all(items, dt)
+
+    def draw(self, screen, view):
+        """
+        Run the draw pass of each kind.
+        """
+        for kind, items in self.entities.items():
+            if items:
+                self.classes[kind].draw_all(items, screen, view)
+
+    def clear(self):
+        """
+        Delete every entity and empty all kinds.
+        """
+        for items in self.entities.values():
+            for item in items:
+                item.delete()
+            items.clear()
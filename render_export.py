@@ -0,0 +1,154 @@
+#############################################################
+# Module Name: Sugar Pop Render Export Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Offline rendering of gameplay to image files or raw video
+#############################################################
+import argparse
+import os
+import queue
+import sys
+import threading
+import time
+
+# Must be set before pygame initializes the display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg
+import main
+from settings import RES, FPS, EXIT_APP, LOAD_NEW_LEVEL, EXPORT_SURFACES
+
+# Frames are 32-bit with the bytes in R, G, B, unused order (ffmpeg's rgb0)
+FRAME_MASKS = (0xff, 0xff00, 0xff0000, 0)
+RAW_PIXEL_FORMAT = 'rgb0'
+
+class FrameWriter:
+    def __init__(self, out, frame_format):
+        """
+        Write rendered frames on a separate thread. Frames arrive as views of
+        the surfaces' own pixel memory, so nothing is copied on the way; the
+        surface is handed back for reuse once it has been written.
+
+        :param out: Directory for numbered images, or file ('-' for stdout) for raw video.
+        :param frame_format: 'png', 'bmp' or 'raw'.
+        """
+        self.frame_format = frame_format
+        self.out = out
+        if frame_format == 'raw':
+            self.stream = sys.stdout.buffer if out == '-' else open(out, 'wb')
+        else:
+            os.makedirs(out, exist_ok=True)
+            self.stream = None
+
+        # Off-screen surfaces cycle between the renderer and the writer
+        self.free = queue.Queue()
+        for _ in range(EXPORT_SURFACES):
+            self.free.put(pg.Surface(RES, 0, 32, masks=FRAME_MASKS))
+        self.filled = queue.Queue()
+        self.error = None
+        self.thread = threading.Thread(target=self._write_frames, daemon=True)
+        self.thread.start()
+
+    def surface(self):
+        """
+        Return a surface to render the next frame into, waiting for the writer if all are in use.
+        """
+        if self.error:
+            raise self.error
+        return self.free.get()
+
+    def submit(self, index, surface):
+        """
+        Queue a rendered surface to be written as frame number index.
+        """
+        self.filled.put((index, surface, surface.get_view('0')))
+
+    def close(self):
+        """
+        Write the frames still queued and close the output.
+        """
+        self.filled.put(None)
+        self.thread.join()
+        if self.stream and self.stream is not sys.stdout.buffer:
+            self.stream.close()
+        if self.error:
+            raise self.error
+
+    def _write_frames(self):
+        while True:
+            item = self.filled.get()
+            if item is None:
+                return
+            index, surface, pixels = item
+            try:
+                if self.stream:
+                    self.stream.write(pixels)
+                else:
+                    # Wrap the pixels in a surface without copying them, just to encode the image
+                    image = pg.image.frombuffer(pixels, RES, 'RGBX')
+                    pg.image.save(image, os.path.join(self.out, f'frame_{index:06d}.{self.frame_format}'))
+                    del image
+            except Exception as error:  # Surface it on the render thread
+                self.error = error
+            # Releasing the view unlocks the surface so it can be drawn again
+            del pixels
+            self.free.put(surface)
+
+def export(level_number, seconds, fps, out, frame_format):
+    """
+    Play a level on the fixed timestep and render every frame off-screen.
+
+    :param level_number: Level to start on; later levels follow as they are completed.
+    :param seconds: Simulation seconds to record.
+    :param fps: Frames per second of the output; must divide the simulation rate.
+    :param out: Output directory or file, see FrameWriter.
+    :param frame_format: 'png', 'bmp' or 'raw'.
+    :return: The number of frames written.
+    """
+    ticks_per_frame = FPS // fps
+    game = main.Game()
+    game.scheduler.cancel(LOAD_NEW_LEVEL)  # Skip the intro and go straight to the level
+    game.intro_image = None
+    game.current_level = level_number
+    if not game.load_level(level_number):
+        raise SystemExit(f'Level {level_number} not found')
+
+    writer = FrameWriter(out, frame_format)
+    written = 0
+    start = time.perf_counter()
+    try:
+        for index in range(int(seconds * fps)):
+            for _ in range(ticks_per_frame):
+                game.tick()
+            if game.scheduler.pending(EXIT_APP):
+                break  # Past the last level
+            surface = writer.surface()
+            game.render(surface)
+            writer.submit(index, surface)
+            written += 1
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - start
+    print(f'{written} frames in {elapsed:.1f} s ({written / elapsed:.1f} frames/s)', file=sys.stderr)
+    if frame_format == 'raw':
+        print(f'raw video: {RES[0]}x{RES[1]} {RAW_PIXEL_FORMAT} at {fps} fps, e.g. '
+              f'ffmpeg -f rawvideo -pix_fmt {RAW_PIXEL_FORMAT} -s {RES[0]}x{RES[1]} -r {fps} -i {out} out.mp4',
+              file=sys.stderr)
+    return written
+
+def main_export():
+    parser = argparse.ArgumentParser(description='Render Sugar Pop gameplay offline')
+    parser.add_argument('out', help="directory for image frames, or file for raw video ('-' for stdout)")
+    parser.add_argument('--level', type=int, default=1, help='level to start on')
+    parser.add_argument('--seconds', type=float, default=30, help='simulation seconds to record')
+    parser.add_argument('--fps', type=int, default=FPS, help=f'output frames per second (must divide {FPS})')
+    parser.add_argument('--format', choices=('png', 'bmp', 'raw'), default='png', help='numbered images or a raw video stream')
+    args = parser.parse_args()
+    if args.fps <= 0 or FPS % args.fps:
+        parser.error(f'--fps must divide {FPS}')
+
+    export(args.level, args.seconds, args.fps, args.out, args.format)
+
+if __name__ == '__main__':
+    main_export()
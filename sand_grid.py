@@ -0,0 +1,268 @@
+#############################################################
+# Module Name: Sugar Pop Sand Grid Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Falling-sand grain backend on a NumPy occupancy grid
+#############################################################
+import numpy as np
+import pygame as pg
+import pymunk
+from settings import SCALE, RES, SAND_SUBSTEPS, REBIN_INTERVAL
+from grain_backend import GrainBackend
+
+class SandGridBackend(GrainBackend):
+    """
+    Cellular automaton sand at pixel resolution. Each cell of the grid holds
+    at most one grain, and every substep all grains fall or slide diagonally
+    at once with whole-array operations, so the cost depends on the grid
+    size rather than the number of grains. A stack of grains over a free cell
+    falls together, so a packed stream keeps moving as one.
+
+    The grid is indexed [x, row] like pygame.surfarray, with row 0 at the top
+    of the world. Level geometry is rasterized from the Segment and Circle
+    shapes in the Pymunk space, so statics, buckets and user drawn lines all
+    block the sand.
+
+    Only the rectangle covering the active chunks is stepped; grains outside
+    it stay frozen in place.
+    """
+    def __init__(self, space, world_size=RES, seed=0):
+        super().__init__(space, world_size)
+        self.width, self.height = world_size
+        self.grains = np.zeros(world_size, dtype=bool)
+        self.solid = np.zeros(world_size, dtype=bool)
+        self.count = 0
+        self.flip = False  # Alternate the preferred slide direction each substep
+        self.rng = np.random.default_rng(seed)
+        self.region = (0, self.width, 0, self.height)  # Stepped cells as (x0, x1, row0, row1)
+        self.hot = set()  # Chunks holding moving grains
+        self.ticks = 0
+        self._solid_key = None
+        self._surface = None
+        self._coin = None  # Random slide sides, read at random offsets
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The draw surface and slide sides are rebuilt on demand and the solid mask on the next step
+        state['_surface'] = None
+        state['_coin'] = None
+        state['_solid_key'] = None
+        return state
+
+    def __len__(self):
+        return self.count
+
+    def to_cell(self, x, y):
+        """
+        Convert a point in physics units to a fractional (x, row) grid position.
+        """
+        return x * SCALE, self.height - y * SCALE
+
+    def cell_window(self, rect):
+        """
+        Return the (x0, x1, row0, row1) grid window covering a (left, bottom, right, top) rectangle.
+        """
+        x0, r1 = self.to_cell(rect[0], rect[1])
+        x1, r0 = self.to_cell(rect[2], rect[3])
+        return (max(int(x0), 0), min(int(x1) + 1, self.width),
+                max(int(r0), 0), min(int(r1) + 1, self.height))
+
+    def drop(self, x, y, count=1):
+        self._update_solid()
+        cx, row = int(x), int(self.height - y)
+        half = int(np.ceil(np.sqrt(count))) + 1
+        x0, x1 = max(cx - half, 0), min(cx + half + 1, self.width)
+        r0, r1 = max(row - half, 0), min(row + half + 1, self.height)
+        window = self.grains[x0:x1, r0:r1]
+        free = np.flatnonzero(~(window | self.solid[x0:x1, r0:r1]))
+        if len(free) > count:
+            free = self.rng.choice(free, count, replace=False)
+        window.flat[free] = True
+        self.count += len(free)
+
+    def state(self):
+        # Cell centers in grid order; grid grains have no identity or
+        # velocity, so a row is an occupied cell rather than a tracked grain
+        xs, rows = np.nonzero(self.grains)
+        positions = np.empty((len(xs), 2), dtype=np.float32)
+        positions[:, 0] = (xs + 0.5) / SCALE
+        positions[:, 1] = (self.height - rows - 0.5) / SCALE
+        return positions, np.zeros_like(positions)
+
+    def step(self, dt):
+        self._update_solid()
+        self.ticks += 1
+        rebin = self.ticks % REBIN_INTERVAL == 0
+        x0, x1, r0, r1 = self.region
+        grains, solid = self.grains[x0:x1, r0:r1], self.solid[x0:x1, r0:r1]
+        if self._coin is None:
+            self._coin = self.rng.random((2 * self.width, 2 * self.height)) < 0.5
+        # Codes for the run scan sort by row, with the low bit set on solid cells
+        codes = np.arange(grains.shape[1], dtype=np.int16) * 2 | solid
+        for _ in range(SAND_SUBSTEPS):
+            # Fall: a grain over a free cell drops, and so does the whole run
+            # of grains stacked on it. Only the columns holding such runs are
+            # scanned, bottom up, for the first cell under each run that is
+            # not a grain; grains get a high bit so they never count as that cell.
+            fall = grains[:, :-1] & ~(grains | solid)[:, 1:]
+            runs = np.flatnonzero((grains[:, :-2] & fall[:, 1:]).any(axis=1))
+            if len(runs):
+                nearest = grains[runs].astype(np.int16)
+                nearest <<= 14
+                nearest |= codes[runs]
+                nearest = np.minimum.accumulate(nearest[:, ::-1], axis=1)[:, ::-1]
+                fall[runs] = grains[runs, :-1] & ((nearest[:, 1:] & 0x4001) == 0)
+            grains[:, :-1] ^= fall
+            grains[:, 1:] |= fall
+
+            # Slide diagonally down where the cell below is taken, both ways at
+            # once. A grain free on both sides picks one at random, so a lone
+            # column spreads out instead of rocking in place, and when two
+            # grains aim for the same cell the preferred side wins.
+            blocked = grains | solid
+            resting = grains[:, :-1] & blocked[:, 1:]
+            open_below = ~blocked[:, 1:]
+            right = resting[:-1] & open_below[1:]  # From x to x + 1
+            left = resting[1:] & open_below[:-1]  # From x + 1 to x
+            either = right[1:] & left[:-1]
+            ox, oy = self.rng.integers(self.width), self.rng.integers(self.height)
+            to_left = either & self._coin[ox:ox + either.shape[0], oy:oy + either.shape[1]]
+            right[1:] ^= to_left
+            left[:-1] ^= either ^ to_left
+            if self.flip:
+                left[1:] &= ~right[:-1]
+            else:
+                right[:-1] &= ~left[1:]
+            grains[:-1, :-1] ^= right
+            grains[1:, :-1] ^= left
+            grains[1:, 1:] |= right
+            grains[:-1, 1:] |= left
+            self.flip = not self.flip
+
+        if rebin:
+            self.rebin(fall, x0, r0)
+
+    def rebin(self, fall, x0, r0):
+        """
+        Find the chunks with falling grains and pick the next region to step.
+
+        :param fall: The fall mask from the last substep, relative to the region.
+        :param x0, r0: Top-left cell of the region.
+        """
+        xs, rows = np.nonzero(fall)
+        if len(xs):
+            # Sample the falling grains; the chunks they are in are what matters
+            sample = slice(None, None, max(1, len(xs) // 4096))
+            xs, rows = xs[sample] + x0, rows[sample] + r0
+            px, py = xs / SCALE, (self.height - rows) / SCALE
+            self.hot = {self.chunks.chunk_at(p) for p in zip(px.tolist(), py.tolist())}
+            self.focus_point = (float(px.mean()), float(py.mean()))
+        else:
+            self.hot = set()
+            self.focus_point = None
+        active = self.wanted | self.chunks.neighbors(self.hot)
+        self.region = self.cell_window(self.chunks.bounds(active))
+
+    def count_in(self, bucket):
+        left, right, bottom, top = bucket.bounds()
+        x0, x1, r0, r1 = self.cell_window((left, bottom, right, top))
+        return int(np.count_nonzero(self.grains[x0:x1, r0:r1]))
+
+    def blast(self, x, y, radius, strength):
+        # There are no velocities on the grid, so throw the grains near the
+        # blast into free cells on an upward ring around it instead
+        cx, row = self.to_cell(x, y)
+        r = radius * SCALE
+        x0, x1, r0, r1 = self.cell_window((x - radius, y - radius, x + radius, y + radius))
+        xs, rows = np.nonzero(self.grains[x0:x1, r0:r1])
+        xs, rows = xs + x0, rows + r0
+        inside = (xs - cx) ** 2 + (rows - row) ** 2 < r ** 2
+        xs, rows = xs[inside], rows[inside]
+        if len(xs) == 0:
+            return
+
+        angle = self.rng.uniform(0, np.pi, len(xs))
+        distance = self.rng.uniform(r, 2 * r, len(xs))
+        new_xs = (cx + np.cos(angle) * distance).astype(int)
+        new_rows = (row - np.sin(angle) * distance).astype(int)
+        ok = (new_xs >= 0) & (new_xs < self.width) & (new_rows >= 0) & (new_rows < self.height)
+        ok[ok] = ~(self.grains[new_xs[ok], new_rows[ok]] | self.solid[new_xs[ok], new_rows[ok]])
+        # Two grains can land on the same cell; keep only the first of each
+        targets = new_xs * self.height + new_rows
+        _, first = np.unique(np.where(ok, targets, -1), return_index=True)
+        keep = np.zeros(len(xs), dtype=bool)
+        keep[first] = True
+        ok &= keep
+
+        self.grains[xs[ok], rows[ok]] = False
+        self.grains[new_xs[ok], new_rows[ok]] = True
+
+    def draw(self, screen, view):
+        if self._surface is None or self._surface.get_size() != view.size:
+            self._surface = pg.Surface(view.size, depth=8)
+            self._surface.set_palette_at(1, (255, 255, 255))
+            self._surface.set_colorkey(0)
+
+        # Nearest grid cell for each pixel of the view
+        left, _, _, top = view.visible_rect()
+        x0, r0 = self.to_cell(left, top)
+        xs = (x0 + np.arange(view.width) / view.render_scale).astype(int)
+        rows = (r0 + np.arange(view.height) / view.render_scale).astype(int)
+        inside_x = (xs >= 0) & (xs < self.width)
+        inside_rows = (rows >= 0) & (rows < self.height)
+        if view.render_scale == 1 and inside_x.all() and inside_rows.all():
+            cells = self.grains[xs[0]:xs[0] + view.width, rows[0]:rows[0] + view.height]
+        else:
+            cells = np.zeros(view.size, dtype=bool)
+            cells[np.ix_(inside_x, inside_rows)] = self.grains[np.ix_(xs[inside_x], rows[inside_rows])]
+        pg.surfarray.blit_array(self._surface, cells.view(np.uint8))
+        screen.blit(self._surface, (0, 0))
+
+    def delete(self):
+        self.grains[:] = False
+        self.count = 0
+
+    def _update_solid(self):
+        """
+        Re-rasterize the level geometry when the shapes in the space change.
+        Shapes on moving bodies are rasterized again every step.
+        """
+        shapes = [s for s in self.space.shapes if isinstance(s, (pymunk.Segment, pymunk.Circle))]
+        moving = any(s.body.body_type != pymunk.Body.STATIC for s in shapes)
+        key = frozenset(id(s) for s in shapes)
+        if key == self._solid_key and not moving:
+            return
+        self._solid_key = key
+
+        self.solid[:] = False
+        for shape in shapes:
+            if isinstance(shape, pymunk.Segment):
+                a = shape.body.local_to_world(shape.a)
+                b = shape.body.local_to_world(shape.b)
+            else:
+                a = b = shape.body.local_to_world(shape.offset)
+            self._rasterize_capsule(a, b, shape.radius)
+
+    def _rasterize_capsule(self, a, b, radius):
+        """
+        Mark every cell within radius of the segment a-b as solid.
+        """
+        ax, ar = self.to_cell(*a)
+        bx, br = self.to_cell(*b)
+        r = max(radius * SCALE, 1.0)
+        x0, x1 = max(int(min(ax, bx) - r), 0), min(int(max(ax, bx) + r) + 1, self.width)
+        r0, r1 = max(int(min(ar, br) - r), 0), min(int(max(ar, br) + r) + 1, self.height)
+        if x0 >= x1 or r0 >= r1:
+            return
+
+        px = np.arange(x0, x1)[:, None] + 0.5
+        pr = np.arange(r0, r1)[None, :] + 0.5
+        dx, dr = bx - ax, br - ar
+        length_sq = dx * dx + dr * dr
+        if length_sq > 0:
+            t = np.clip(((px - ax) * dx + (pr - ar) * dr) / length_sq, 0, 1)
+        else:
+            t = 0
+        dist_sq = (px - ax - t * dx) ** 2 + (pr - ar - t * dr) ** 2
+        self.solid[x0:x1, r0:r1] |= dist_sq <= r * r
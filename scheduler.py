@@ -0,0 +1,59 @@
+#############################################################
+# Module Name: Sugar Pop Scheduler Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Simulation-time event scheduler for the sugar pop game
+#############################################################
+import heapq
+
+class Scheduler:
+    def __init__(self):
+        """
+        Keep a heap of events keyed on simulation time instead of wall-clock
+        time, so level flow runs at whatever speed the simulation runs.
+        """
+        self.time = 0.0  # Simulation seconds elapsed
+        self.events = []  # Heap of (due time, sequence, event type)
+        self.sequence = 0  # Breaks ties so events due together fire in the order set
+
+    def set_timer(self, event_type, delay):
+        """
+        Fire an event once after a delay, replacing any pending one of the same
+        type like pg.time.set_timer does. A delay of 0 cancels the event.
+
+        :param event_type: The event type to fire.
+        :param delay: Delay in simulation seconds.
+        """
+        self.cancel(event_type)
+        if delay > 0:
+            heapq.heappush(self.events, (self.time + delay, self.sequence, event_type))
+            self.sequence += 1
+
+    def cancel(self, event_type):
+        """
+        Remove any pending event of the given type.
+        """
+        remaining = [event for event in self.events if event[2] != event_type]
+        if len(remaining) != len(self.events):
+            heapq.heapify(remaining)
+            self.events = remaining
+
+    def pending(self, event_type):
+        """
+        Return True if an event of the given type is waiting to fire.
+        """
+        return any(event[2] == event_type for event in self.events)
+
+    def advance(self, dt):
+        """
+        Move simulation time forward and return the event types that came due, in order.
+
+        :param dt: Simulation seconds to advance.
+        """
+        self.time += dt
+        due = []
+        # Allow for rounding when summing many small time steps
+        while self.events and self.events[0][0] <= self.time + 1e-9:
+            due.append(heapq.heappop(self.events)[2])
+        return due
@@ -0,0 +1,80 @@
+#############################################################
+# Module Name: Sugar Pop Seesaw Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: The pivoting seesaw implementation of the sugar pop game
+#############################################################
+import pygame as pg
+import pymunk
+from settings import SCALE
+
+class Seesaw:
+    def __init__(self, space, x, y, length, color='brown', line_width=5, mass=10, friction=0.3,
+                 elasticity=0.5, stiffness=0, damping=0):
+        """
+        Initialize a plank that pivots freely around its center.
+
+        :param space: The Pymunk space.
+        :param x, y: Pivot position in Pygame coordinates (Y up, like the other level items).
+        :param length: Length of the plank in pixels.
+        :param color: Color of the plank for rendering in Pygame.
+        :param line_width: Width of the plank for rendering in Pygame.
+        :param mass: Mass of the plank.
+        :param friction: Friction coefficient of the plank.
+        :param elasticity: Elasticity (bounciness) of the plank.
+        :param stiffness: Stiffness of the spring pulling the plank level (0 for none).
+        :param damping: Damping of the spring pulling the plank level.
+        """
+        self.space = space
+        self.color = color
+        self.line_width = line_width
+
+        pivot = (x / SCALE, y / SCALE)
+        half = length / SCALE / 2
+        thickness = 0.1
+
+        # The plank body rotates around the pivot
+        moment = pymunk.moment_for_segment(mass, (-half, 0), (half, 0), thickness)
+        self.body = pymunk.Body(mass, moment)
+        self.body.position = pivot
+        self.shape = pymunk.Segment(self.body, (-half, 0), (half, 0), thickness)
+        self.shape.friction = friction
+        self.shape.elasticity = elasticity
+
+        # Pin the plank's center to the world
+        self.constraints = [pymunk.PivotJoint(space.static_body, self.body, pivot)]
+        if stiffness:
+            # Pull the plank back towards level
+            self.constraints.append(pymunk.DampedRotarySpring(space.static_body, self.body, 0, stiffness, damping))
+
+        self.space.add(self.body, self.shape, *self.constraints)
+
+    @classmethod
+    def from_level(cls, space, data):
+        """
+        Build a seesaw from its entry in the level file.
+        """
+        return cls(space, **data)
+
+    @classmethod
+    def draw_all(cls, items, screen, view):
+        """
+        Draw every seesaw's plank and pivot.
+        """
+        pivot_color = pg.Color('red')
+        pivot_radius = view.line_width(5)
+        for item in items:
+            body = item.body
+            start = view.to_screen(body.local_to_world(item.shape.a))
+            end = view.to_screen(body.local_to_world(item.shape.b))
+            pg.draw.line(screen, pg.Color(item.color), start, end, view.line_width(item.line_width))
+            pg.draw.circle(screen, pivot_color, view.to_screen(body.position), pivot_radius)
+
+    def delete(self):
+        """
+        Remove the seesaw's body, shape and joints from the Pymunk space.
+        """
+        if self.body is not None:
+            self.space.remove(self.body, self.shape, *self.constraints)
+            self.body = None
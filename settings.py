@@ -16,10 +16,57 @@ FPS = 60
 SCALE = 30  # Scale Factor: 30 pixels per meter
 MAX_TIME_STEP = 1.0 / FPS  # Simulation step
 
+# Internal render scale. The world is drawn at this fraction of the window
+# size and upscaled in one pass; the HUD and messages stay at full resolution.
+RENDER_SCALE = 1.0
+
+# Simulation speed. TIME_WARP scales simulation time against wall-clock time;
+# unthrottled runs step this many fixed ticks per frame without a frame cap.
+TIME_WARP = 1.0
+UNTHROTTLED_TICKS_PER_FRAME = 10
+MAX_FRAME_TIME = 0.25  # Longest frame the simulation will try to catch up on
+
+# Pymunk's threaded solver (not available on Windows). Opt in per machine after
+# checking 'python benchmark.py threads'.
+THREADED_SOLVER = False
+SOLVER_THREADS = 2
+SOLVER_THREAD_COUNTS = (1, 2)  # Pymunk silently clamps Space.threads to these
+
+# Large levels are split into chunks; only chunks near the camera, the spout
+# or moving grains are simulated, the rest are frozen
+CHUNK_SIZE = 256  # Pixels per chunk side
+CHUNK_MARGIN = 1  # Chunks kept active around the screen
+REBIN_INTERVAL = 20  # Ticks between chunk activation updates
+ACTIVE_SPEED = 0.5  # Grains faster than this (physics units/s) keep their chunk active
+CAMERA_SMOOTHING = 3.0  # How quickly the camera catches up with the flow
+CAMERA_PAN_STEP = 200  # Pixels moved per arrow key press
+
+# Grain traces: physics steps between frames, and how much the writer thread may fall behind
+TRACE_INTERVAL = 10
+TRACE_MAX_GRAINS = 10000  # Larger levels trace an even sample of their grains
+TRACE_QUEUE_BYTES = 64 * 2**20
+
+# Offline render export: off-screen surfaces shared between the renderer and the writer thread
+EXPORT_SURFACES = 4
+
+# Decorative particles (not part of the physics)
+PARTICLE_CAPACITY = 20000  # Most particles alive at once
+PARTICLE_GRAVITY = -10  # Matches the space's gravity, physics units/s^2
+PARTICLE_LIFETIME = 1.5  # Seconds
+PARTICLE_SIZE = 2  # Pixels
+BUCKET_BURST_PARTICLES = 800
+LEVEL_COMPLETE_PARTICLES = 3000
+
+# Sand grid backend: cells each grain can fall per frame
+SAND_SUBSTEPS = 4
+
 # Define collision types
 FLOOR_COLLISION_TYPE = 1
 BOX_COLLISION_TYPE = 2
 
+# Collision filter category for sugar grains
+GRAIN_CATEGORY = 0b1
+
 
 # Level Info
 LEVEL_FILE_NAME = './levels/levelX.json'
@@ -0,0 +1,221 @@
+#############################################################
+# Module Name: Sugar Pop Soak Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Headless soak test that cycles through every level looking for leaks
+#############################################################
+import argparse
+import gc
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+
+# Must be set before pygame initializes the display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import dynamic_item
+import main
+from settings import LEVEL_FILE_NAME, LOAD_NEW_LEVEL, SCALE
+
+# Space object counts that must come back exactly on every load of a level.
+# The shared static body holds on to every shape ever attached to it, even
+# after the shape leaves the space, so it is counted too.
+SPACE_COUNTS = {
+    'bodies': lambda space: len(space.bodies),
+    'shapes': lambda space: len(space.shapes),
+    'constraints': lambda space: len(space.constraints),
+    'static_body.shapes': lambda space: len(space.static_body.shapes),
+}
+
+# Allocations made by the soak itself, tracemalloc and the import machinery are not the game's
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+def level_numbers():
+    """
+    Return the numbers of the shipped levels, in order.
+    """
+    numbers = []
+    while os.path.exists(LEVEL_FILE_NAME.replace('X', str(len(numbers) + 1))):
+        numbers.append(len(numbers) + 1)
+    return numbers
+
+def rss_mb():
+    """
+    Return the resident set size of this process in megabytes.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        # No procfs; fall back to the peak size, which still catches steady growth
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+def allocation_sizes():
+    """
+    Return the traced memory per source line as a {(file, line): bytes} dict.
+    Only these totals are kept, never the snapshot itself, so the soak's own
+    bookkeeping stays out of the memory it measures.
+    """
+    snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+    return {(stat.traceback[0].filename, stat.traceback[0].lineno): stat.size
+            for stat in snapshot.statistics('lineno')}
+
+def take_sample(game):
+    """
+    Record memory use and the number of objects in the game's space.
+    """
+    gc.collect()
+    sample = {name: count(game.space) for name, count in SPACE_COUNTS.items()}
+    sample['rss'] = rss_mb()
+    sample['traced'] = tracemalloc.get_traced_memory()[0] / 2**20
+    sample['allocations'] = allocation_sizes()
+    return sample
+
+def add_stroke(game, rng):
+    """
+    Draw a random line across the visible part of the world, the way the mouse would.
+    """
+    line = dynamic_item.DynamicItem(game.space, 'blue')
+    x = game.camera.x + rng.uniform(0.1, 0.9) * game.camera.width
+    y = game.camera.y + rng.uniform(0.1, 0.9) * game.camera.height
+    for _ in range(rng.randint(2, 6)):
+        line.add_vertex(x, y)
+        x += rng.uniform(-80, 80) / SCALE
+        y += rng.uniform(-40, 40) / SCALE
+    return line
+
+def play_level(game, ticks, stroke_every, rng):
+    """
+    Run a loaded level for a number of ticks or until it is complete, adding
+    strokes as it goes. The last stroke is left unfinished, as if the mouse
+    were still down when the level changes.
+    """
+    for tick in range(1, ticks + 1):
+        game.tick()
+        if tick % stroke_every == 0:
+            if game.current_line is not None:
+                game.entities.add('lines', game.current_line)
+            game.current_line = add_stroke(game, rng)
+        if tick % 10 == 0:
+            game.render(game.screen)
+        if game.scheduler.pending(LOAD_NEW_LEVEL):
+            break
+
+def report_top(sample, top):
+    """
+    Print the source lines holding the most traced memory.
+    """
+    print('  top allocations:')
+    largest = sorted(sample['allocations'].items(), key=lambda item: item[1], reverse=True)
+    for (filename, lineno), size in largest[:top]:
+        print(f'    {filename}:{lineno}: {size / 2**10:.1f} KiB')
+
+def report_growth(level_number, baseline, sample, top):
+    """
+    Print the allocations that grew the most since the baseline load of the level.
+    """
+    print(f'  top allocations grown since the baseline load of level {level_number}:')
+    before = baseline['allocations']
+    growth = sorted(((size - before.get(line, 0), line) for line, size in sample['allocations'].items()), reverse=True)
+    for grown, (filename, lineno) in growth[:top]:
+        print(f'    {filename}:{lineno}: +{grown / 2**10:.1f} KiB')
+
+def soak(cycles, hours, ticks, stroke_every, memory_tolerance, top, seed, warmup_cycles):
+    """
+    Cycle through every level until the cycle count or time runs out, and
+    compare each load of a level with its earlier loads. Object counts must
+    match the first load exactly. Memory is compared with the first load
+    after warmup_cycles full cycles, since those warm up caches, fonts and
+    the allocator's high-water mark (every level has been played by then);
+    it may grow by at most memory_tolerance megabytes.
+
+    Return a list of failure messages, empty if nothing grew.
+    """
+    numbers = level_numbers()
+    if not numbers:
+        return ['No levels found']
+
+    tracemalloc.start()
+    rng = random.Random(seed)
+    game = main.Game()
+    game.scheduler.cancel(LOAD_NEW_LEVEL)  # The soak picks the levels itself
+    game.intro_image = None
+
+    first = {}  # Level number -> sample at its first load
+    baseline = {}  # Level number -> sample at its first load after the warm-up
+    failures = []
+    deadline = time.monotonic() + hours * 3600 if hours else None
+    cycle = 0
+    while (not cycles or cycle < cycles) and (deadline is None or time.monotonic() < deadline):
+        cycle += 1
+        for number in numbers:
+            game.current_level = number
+            if not game.load_level(number):
+                failures.append(f'Level {number} failed to load')
+                return failures
+            sample = take_sample(game)
+            counts = ' '.join(f'{name}={sample[name]}' for name in SPACE_COUNTS)
+            print(f"cycle {cycle} level {number}: rss={sample['rss']:.1f}MB traced={sample['traced']:.1f}MB {counts}")
+            report_top(sample, top)
+
+            first.setdefault(number, sample)
+            for name in SPACE_COUNTS:
+                if sample[name] != first[number][name]:
+                    failures.append(f'cycle {cycle} level {number}: space.{name} is {sample[name]}, was {first[number][name]} on the first load')
+            if number in baseline:
+                grew = False
+                for name in ('rss', 'traced'):
+                    if sample[name] - baseline[number][name] > memory_tolerance:
+                        failures.append(f'cycle {cycle} level {number}: {name} grew from {baseline[number][name]:.1f}MB to {sample[name]:.1f}MB')
+                        grew = True
+                if grew:
+                    report_growth(number, baseline[number], sample, top)
+            elif cycle > warmup_cycles:
+                baseline[number] = sample
+            if failures:
+                return failures
+
+            # Only the baseline allocations are compared against
+            if baseline.get(number) is not sample:
+                del sample['allocations']
+
+            play_level(game, ticks, stroke_every, rng)
+    print(f'Soak passed: {cycle} cycles of {len(numbers)} levels')
+    return failures
+
+def main_soak():
+    parser = argparse.ArgumentParser(description='Sugar Pop headless soak test')
+    parser.add_argument('--cycles', type=int, default=5, help='passes through every level (0 to run until --hours)')
+    parser.add_argument('--hours', type=float, default=0, help='stop after this many hours (0 for no limit)')
+    parser.add_argument('--ticks', type=int, default=600, help='ticks to run each level for')
+    parser.add_argument('--stroke-every', type=int, default=120, help='ticks between synthetic strokes')
+    parser.add_argument('--memory-tolerance', type=float, default=8.0, help='megabytes RSS or traced memory may grow by')
+    parser.add_argument('--warmup-cycles', type=int, default=2, help='cycles to run before memory is measured against')
+    parser.add_argument('--top', type=int, default=10, help='allocations to list at each load and when memory grows')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the synthetic strokes')
+    args = parser.parse_args()
+    if not args.cycles and not args.hours:
+        parser.error('give --cycles or --hours')
+    if args.cycles and args.cycles < args.warmup_cycles + 2:
+        parser.error('--cycles must leave at least two cycles after --warmup-cycles to compare memory')
+
+    failures = soak(args.cycles, args.hours, args.ticks, args.stroke_every, args.memory_tolerance, args.top, args.seed,
+                    args.warmup_cycles)
+    if failures:
+        for failure in failures:
+            print(f'SOAK FAILED: {failure}', file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main_soak()
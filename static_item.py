@@ -7,9 +7,12 @@
 #############################################################
 import pygame as pg
 import pymunk
-from settings import SCALE, HEIGHT
+from settings import SCALE
 
 class StaticItem:
+    _layer = None  # (surface, padding) with every static drawn, shared by all statics
+    _layer_key = None  # Statics and scale the layer was drawn for
+
     def __init__(self, space, x1, y1, x2, y2, color='gray', line_width=3, friction=0.3, elasticity=0.5):
         """
         Initialize a static line segment in Pymunk between two points (x1, y1) and (x2, y2).
@@ -32,38 +35,71 @@ class StaticItem:
         pymunk_x1, pymunk_y1 = x1 / SCALE, y1 / SCALE
         pymunk_x2, pymunk_y2 = x2 / SCALE, y2 / SCALE
 
-        # Create a static body for the space
-        self.body = space.static_body
+        # Give the segment its own static body. The space's shared static body
+        # keeps every shape ever attached to it, so level geometry would leak.
+        self.body = pymunk.Body(body_type=pymunk.Body.STATIC)
 
         # Create a segment shape between the two points
         self.segment = pymunk.Segment(self.body, (pymunk_x1, pymunk_y1), (pymunk_x2, pymunk_y2), 0.1)  # Thickness of 0.1
         self.segment.friction = friction
         self.segment.elasticity = elasticity
 
-        # Add the segment to the Pymunk space
-        self.space.add(self.segment)
+        # Add the body and segment to the Pymunk space
+        self.space.add(self.body, self.segment)
 
-    def draw(self, screen):
+    @classmethod
+    def from_level(cls, space, data):
         """
-        Draw the static line segment on the Pygame screen.
-        
-        :param screen: The Pygame screen to draw the line on.
+        Build a static item from its entry in the level file.
+        """
+        return cls(space, data['x1'], data['y1'], data['x2'], data['y2'], data['color'], data['line_width'], data['friction'], data['restitution'])
+
+    @classmethod
+    def draw_all(cls, items, screen, view):
+        """
+        Draw every static line segment. Statics never move, so they are drawn
+        once into a layer covering the whole world, which is redrawn only
+        when the statics or the scale change, and blitted at the view origin.
+        """
+        ppm = view.pixels_per_meter
+        key = (tuple(items), ppm, screen.get_bitsize(), screen.get_masks())
+        if key != cls._layer_key:
+            cls._layer = cls._draw_layer(items, screen, view)
+            cls._layer_key = key
+        layer, pad = cls._layer
+        top = layer.get_height() - pad - view.height - view.origin[1] * ppm
+        screen.blit(layer, (0, 0), (round(view.origin[0] * ppm) + pad, round(top), view.width, view.height))
+
+    @classmethod
+    def _draw_layer(cls, items, screen, view):
+        """
+        Draw the statics into a transparent layer in the screen's pixel format.
+
+        :return: The layer and the padding around the world in pixels.
         """
-        # Convert Pymunk coordinates to Pygame screen coordinates for rendering
-        start_x = self.segment.a[0] * SCALE
-        start_y = HEIGHT - self.segment.a[1] * SCALE
-        end_x = self.segment.b[0] * SCALE
-        end_y = HEIGHT - self.segment.b[1] * SCALE
-        start = (start_x, start_y)
-        end = (end_x, end_y)
+        ppm = view.pixels_per_meter
+        pad = max(view.line_width(item.line_width) for item in items)
+        right = max(max(item.segment.a[0], item.segment.b[0]) for item in items) * ppm
+        top = max(max(item.segment.a[1], item.segment.b[1]) for item in items) * ppm
+        layer = pg.Surface((int(right) + 2 * pad + 1, int(top) + 2 * pad + 1), 0, screen)
+        layer.fill((0, 0, 0))
+        layer.set_colorkey((0, 0, 0), pg.RLEACCEL)
 
-        # Draw the line
-        pg.draw.line(screen, pg.Color(self.color), start, end, self.line_width)
+        height = layer.get_height()
+        colors = {}  # Color name -> pg.Color, shared by most statics
+        for item in items:
+            color = colors.get(item.color)
+            if color is None:
+                color = colors[item.color] = pg.Color(item.color)
+            start = (item.segment.a[0] * ppm + pad, height - pad - item.segment.a[1] * ppm)
+            end = (item.segment.b[0] * ppm + pad, height - pad - item.segment.b[1] * ppm)
+            pg.draw.line(layer, color, start, end, view.line_width(item.line_width))
+        return layer, pad
 
     def delete(self):
         """
-        Delete the static item by removing its segment from the Pymunk space.
+        Delete the static item by removing its body and segment from the Pymunk space.
         """
         if self.segment:
-            self.space.remove(self.segment)  # Remove the segment from the Pymunk space
+            self.space.remove(self.body, self.segment)  # Remove the segment from the Pymunk space
             self.segment = None  # Clear the reference to the segment
@@ -7,18 +7,24 @@
 #############################################################
 import pygame as pg
 import pymunk
-from settings import SCALE, HEIGHT
+from settings import SCALE, GRAIN_CATEGORY
 
 class sugar_grain:
-    def __init__(self, space, x, y, friction=0.3):
+    def __init__(self, space, x, y, friction=0.3, shape='poly', radius=1, elasticity=0.5, collide_with_grains=True):
         """
         Initialize a sugar grain as a small dynamic body in Pymunk.
         
         :param space: The Pymunk space where the grain will be created.
         :param x: Initial x position in Pygame coordinates.
         :param y: Initial y position in Pygame coordinates.
+        :param friction: Friction coefficient of the grain.
+        :param shape: 'poly' for a square grain or 'circle' for a round one (cheaper to collide).
+        :param radius: Half the grain's size in pixels.
+        :param elasticity: Elasticity (bounciness) of the grain.
+        :param collide_with_grains: If False, grains pass through each other and only hit the level.
         """
         self.space = space
+        self.radius = radius
 
         # Convert Pygame coordinates to Pymunk coordinates (Pymunk's Y-axis points upwards)
         pos_x = x / SCALE
@@ -26,18 +32,28 @@ class sugar_grain:
 
         # Create a dynamic body with mass and moment of inertia
         mass = 1.0
-        size = 2 / SCALE  # Size of the square in physics units
-        moment = pymunk.moment_for_box(mass, (size, size))
+        size = 2 * radius / SCALE  # Size of the grain in physics units
+        s = size / 2  # Half the size for vertex calculations
+        if shape == 'circle':
+            moment = pymunk.moment_for_circle(mass, 0, s)
+        else:
+            moment = pymunk.moment_for_box(mass, (size, size))
 
         self.body = pymunk.Body(mass, moment)
         self.body.position = pos_x, pos_y
 
-        # Define a small square shape attached to the body
-        s = size / 2  # Half the size for vertex calculations
-        vertices = [(-s, -s), (-s, s), (s, s), (s, -s)]
-        self.shape = pymunk.Poly(self.body, vertices)
+        # Define a small circle or square shape attached to the body
+        if shape == 'circle':
+            self.shape = pymunk.Circle(self.body, s)
+        else:
+            vertices = [(-s, -s), (-s, s), (s, s), (s, -s)]
+            self.shape = pymunk.Poly(self.body, vertices)
         self.shape.friction = friction
-        self.shape.elasticity = 0.5  # Adjust as needed
+        self.shape.elasticity = elasticity
+
+        # Leave grains out of each other's collision mask when they shouldn't stack
+        if not collide_with_grains:
+            self.shape.filter = pymunk.ShapeFilter(categories=GRAIN_CATEGORY, mask=pymunk.ShapeFilter.ALL_MASKS() ^ GRAIN_CATEGORY)
 
         # Add the body and shape to the space
         self.space.add(self.body, self.shape)
@@ -49,22 +65,37 @@ class sugar_grain:
         """
         pass
 
-    def draw(self, screen):
+    def draw(self, screen, view):
         """
         Draw the sugar grain on the Pygame screen.
         
         :param screen: The Pygame surface to draw the grain on.
+        :param view: The View mapping physics coordinates to the screen.
         """
         # Get the position of the grain in Pygame coordinates
-        pos = self.body.position
-        screen_x = pos.x * SCALE
-        screen_y = HEIGHT - pos.y * SCALE
+        screen_x, screen_y = view.to_screen(self.body.position)
 
         # Draw a small square at this position
-        pg.draw.rect(screen, pg.Color('white'), (screen_x - 1, screen_y - 1, 2, 2))
+        size = view.line_width(2 * self.radius)
+        pg.draw.rect(screen, pg.Color('white'), (screen_x - size / 2, screen_y - size / 2, size, size))
 
     def delete(self):
         """
         Remove the sugar grain from the Pymunk space.
         """
-        self.space.remove(self.body, self.shape)
+        if self.body.space is not None:  # Frozen grains are already out of the space
+            self.space.remove(self.body, self.shape)
+
+    def freeze(self):
+        """
+        Take the grain out of the simulation, leaving it where it is.
+        """
+        if self.body.space is not None:
+            self.space.remove(self.body, self.shape)
+
+    def thaw(self):
+        """
+        Put a frozen grain back into the simulation.
+        """
+        if self.body.space is None:
+            self.space.add(self.body, self.shape)
@@ -0,0 +1,48 @@
+#############################################################
+# Module Name: Sugar Pop View Module
+# Project: Sugar Pop Program
+# Date: Oct 19, 2026
+# By: Samwel Obiero
+# Description: Maps physics coordinates to the surface the world is drawn on
+#############################################################
+from settings import SCALE, WIDTH, HEIGHT
+
+class View:
+    def __init__(self, render_scale=1.0):
+        """
+        Describe the surface the game world is rendered into.
+
+        :param render_scale: Size of the world surface relative to the window (1.0 is full resolution).
+        """
+        self.render_scale = render_scale
+        self.size = self.width, self.height = max(1, round(WIDTH * render_scale)), max(1, round(HEIGHT * render_scale))
+        self.pixels_per_meter = SCALE * render_scale
+        self.origin = (0.0, 0.0)  # World point at the bottom-left of the screen, set by the camera
+
+    def to_screen(self, p):
+        """
+        Convert a point in Pymunk coordinates to world surface coordinates.
+
+        :param p: The (x, y) point in physics units.
+        """
+        return (p[0] - self.origin[0]) * self.pixels_per_meter, self.height - (p[1] - self.origin[1]) * self.pixels_per_meter
+
+    def to_world(self, x, y):
+        """
+        Convert a point in window coordinates, such as the mouse position, to Pymunk coordinates.
+        """
+        return x / SCALE + self.origin[0], (HEIGHT - y) / SCALE + self.origin[1]
+
+    def visible_rect(self):
+        """
+        Return the (left, bottom, right, top) rectangle of the world on screen in physics units.
+        """
+        return self.origin[0], self.origin[1], self.origin[0] + WIDTH / SCALE, self.origin[1] + HEIGHT / SCALE
+
+    def line_width(self, width):
+        """
+        Scale a line width given in window pixels, keeping at least one pixel.
+
+        :param width: The line width at full resolution.
+        """
+        return max(1, round(width * self.render_scale))